@@ -1,44 +1,79 @@
+import logging
 import re
-from typing import Dict, List, Optional
-from langdetect import detect, LangDetectException
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+def _rank_month_names(month_map: Dict[str, int]) -> Dict[str, Tuple[int, int]]:
+    """Rank each month name by the earliest map entry it contains, paired with that entry's month."""
+    entries = list(month_map.items())
+    return {
+        name: min((index, number) for index, (entry, number) in enumerate(entries) if entry in name)
+        for name in month_map
+    }
 
 class CurrentPositionExtractor:
+    # Job role indicators in English and Hungarian
+    job_indicators = [
+        # English job indicators
+        'developer', 'engineer', 'manager', 'consultant', 'analyst', 
+        'specialist', 'coordinator', 'assistant', 'director', 'lead',
+        'intern', 'trainee', 'administrator', 'supervisor', 'senior', 'junior',
+        'architect', 'designer', 'programmer', 'technician', 'officer',
+        'executive', 'founder', 'head', 'chief', 'president', 'principal',
+        'full-stack', 'frontend', 'backend', 'software', 'web', 'mobile',
+        'data', 'system', 'network', 'cloud', 'devops', 'qa', 'test',
+        # Hungarian job indicators
+        'fejlesztő', 'mérnök', 'vezető', 'tanácsadó', 'elemző',
+        'szakértő', 'koordinátor', 'asszisztens', 'igazgató',
+        'gyakornok', 'adminisztrátor', 'felügyelő', 'szenior', 'junior',
+        'architekt', 'tervező', 'programozó', 'technikus', 'tisztviselő',
+        'ügyvezető', 'alapító', 'vezérigazgató', 'elnök', 'főmérnök',
+        'projektmenedzser', 'csoportvezető', 'osztályvezető', 'részlegvezető',
+        'alkalmazás', 'rendszer', 'hálózati', 'adatbázis', 'minőségbiztosítási',
+        'szoftverfejlesztő', 'webfejlesztő', 'mobilfejlesztő', 'full-stack fejlesztő',
+        'frontend fejlesztő', 'backend fejlesztő', 'rendszergazda', 'üzemeltető',
+        'informatikus', 'műszaki', 'technológiai', 'kutató', 'oktató'
+    ]
+    
+    # Current position time indicators
+    current_indicators = [
+        # English indicators
+        'present', 'current', 'now', 'ongoing', 'to date',
+        # Hungarian indicators
+        'jelenlegi', 'jelenleg', 'mostani', 'folyamatban', 'napjainkig',
+        'mai napig', 'jelen', 'aktuális', 'folyó', '-', '–'
+    ]
+
+    # Month names to numbers; abbreviations are plain substrings, so 'jan' also matches 'január'
+    month_map = {
+        # English months
+        'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+        'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+        # Hungarian months
+        'január': 1, 'február': 2, 'március': 3, 'április': 4, 'május': 5, 'június': 6,
+        'július': 7, 'augusztus': 8, 'szeptember': 9, 'október': 10, 'november': 11, 'december': 12,
+        # Short Hungarian months
+        'jan': 1, 'feb': 2, 'már': 3, 'ápr': 4, 'máj': 5, 'jún': 6,
+        'júl': 7, 'aug': 8, 'szept': 9, 'okt': 10, 'nov': 11, 'dec': 12
+    }
+
+    # Compiled once so date scoring and the company check do a single scan per job entry
+    _job_indicator_re = re.compile('|'.join(re.escape(indicator.lower()) for indicator in job_indicators))
+    _current_re = re.compile('|'.join(re.escape(indicator.lower()) for indicator in current_indicators))
+    _open_range_re = re.compile(r'\b\d{4}\.\s*-\s*(?:jelenleg|napjainkig|folyamatban)')
+    _year_re = re.compile(r'\b(?:19|20)\d{2}\b')
+
+    # One pass finds the longest month name starting at each position (the lookahead lets matches
+    # overlap); each name is ranked by the earliest map entry it contains, so the result is the
+    # first entry in map order that occurs anywhere in the string
+    _month_re = re.compile('(?=(' + '|'.join(re.escape(name) for name in sorted(month_map, key=len, reverse=True)) + '))')
+    _month_rank = _rank_month_names(month_map)
+
     def __init__(self, nlp_en, nlp_hu):
-        """Initialize CurrentPositionExtractor with spaCy models and define job indicators."""
+        """Initialize CurrentPositionExtractor with spaCy models."""
         self.nlp_en = nlp_en
         self.nlp_hu = nlp_hu
-        
-        # Job role indicators in English and Hungarian
-        self.job_indicators = [
-            # English job indicators
-            'developer', 'engineer', 'manager', 'consultant', 'analyst', 
-            'specialist', 'coordinator', 'assistant', 'director', 'lead',
-            'intern', 'trainee', 'administrator', 'supervisor', 'senior', 'junior',
-            'architect', 'designer', 'programmer', 'technician', 'officer',
-            'executive', 'founder', 'head', 'chief', 'president', 'principal',
-            'full-stack', 'frontend', 'backend', 'software', 'web', 'mobile',
-            'data', 'system', 'network', 'cloud', 'devops', 'qa', 'test',
-            # Hungarian job indicators
-            'fejlesztő', 'mérnök', 'vezető', 'tanácsadó', 'elemző',
-            'szakértő', 'koordinátor', 'asszisztens', 'igazgató',
-            'gyakornok', 'adminisztrátor', 'felügyelő', 'szenior', 'junior',
-            'architekt', 'tervező', 'programozó', 'technikus', 'tisztviselő',
-            'ügyvezető', 'alapító', 'vezérigazgató', 'elnök', 'főmérnök',
-            'projektmenedzser', 'csoportvezető', 'osztályvezető', 'részlegvezető',
-            'alkalmazás', 'rendszer', 'hálózati', 'adatbázis', 'minőségbiztosítási',
-            'szoftverfejlesztő', 'webfejlesztő', 'mobilfejlesztő', 'full-stack fejlesztő',
-            'frontend fejlesztő', 'backend fejlesztő', 'rendszergazda', 'üzemeltető',
-            'informatikus', 'műszaki', 'technológiai', 'kutató', 'oktató'
-        ]
-        
-        # Current position time indicators
-        self.current_indicators = [
-            # English indicators
-            'present', 'current', 'now', 'ongoing', 'to date',
-            # Hungarian indicators
-            'jelenlegi', 'jelenleg', 'mostani', 'folyamatban', 'napjainkig',
-            'mai napig', 'jelen', 'aktuális', 'folyó', '-', '–'
-        ]
 
     # MAIN EXTRACTION METHOD
     def extract_current_position(self, text: str, work_experience: List[Dict]) -> Optional[str]:
@@ -47,82 +82,66 @@ class CurrentPositionExtractor:
             return None
 
         try:
-            def get_date_score(job):
-                date = job.get('date', '')
-                date_range = job.get('date_range', '')
-                
-                date_text = (date + date_range).lower()
-                if any(indicator.lower() in date_text for indicator in self.current_indicators):
-                    return (float('inf'), float('inf'), date)
-                
-                if re.search(r'\b\d{4}\.\s*-\s*(jelenleg|napjainkig|folyamatban)', date_text):
-                    return (float('inf'), float('inf'), date)
-                
-                year, month = self._parse_date(date if date else date_range)
-                return (year, month, date)
-            
-            sorted_experiences = sorted(
-                [exp for exp in work_experience if exp.get('job_title') or exp.get('company')],
-                key=get_date_score,
-                reverse=True
+            # Only the most recent entry is needed, so take the maximum instead of sorting them all;
+            # like the stable sort, it keeps the earliest of equally recent entries
+            most_recent = max(
+                (exp for exp in work_experience if exp.get('job_title') or exp.get('company')),
+                key=self._date_score,
+                default=None
             )
             
-            if sorted_experiences:
-                most_recent = sorted_experiences[0]
-                
+            if most_recent:
                 if most_recent.get('job_title'):
                     return most_recent['job_title']
                 elif most_recent.get('company'):
-                    for indicator in self.job_indicators:
-                        if indicator.lower() in most_recent['company'].lower():
-                            return most_recent['company']
+                    if self._job_indicator_re.search(most_recent['company'].lower()):
+                        return most_recent['company']
             
             return None
 
         except Exception as e:
-            print(f"Current position extraction failed: {str(e)}")
+            logger.warning("Current position extraction failed: %s", e)
             for exp in work_experience:
                 if exp.get('job_title'):
                     return exp['job_title']
             return None
 
     # HELPER METHODS
-    def get_nlp_model_for_text(self, text: str):
-        """Determine the language of the text and return the appropriate spaCy NLP model."""
-        try:
-            language = detect(text)
-            return self.nlp_hu if language == 'hu' else self.nlp_en
-        except LangDetectException:
-            return self.nlp_en
+    def _date_score(self, job: Dict) -> tuple:
+        """Score a job by recency; current positions rank above every dated one."""
+        date = job.get('date', '')
+        date_range = job.get('date_range', '')
+        
+        # Experience entries normally carry only 'date', so skip the concatenation copy then
+        date_text = (date + date_range).lower() if date_range else date.lower()
+        if self._is_current(date_text):
+            return (float('inf'), float('inf'), date)
+        
+        if self._open_range_re.search(date_text):
+            return (float('inf'), float('inf'), date)
+        
+        year, month = self._parse_date(date if date else date_range)
+        return (year, month, date)
+
+    def _is_current(self, date_lower: str) -> bool:
+        """Check a lowercased date string for any current-position indicator."""
+        # Most date ranges contain a dash, which is itself an indicator, so test it before the full regex
+        return '-' in date_lower or '–' in date_lower or self._current_re.search(date_lower) is not None
 
     def _parse_date(self, date_str: str) -> tuple:
         """Parse date string into a comparable tuple of (year, month)."""
         try:
-            if any(indicator.lower() in date_str.lower() for indicator in self.current_indicators):
+            date_lower = date_str.lower()
+            if self._is_current(date_lower):
                 return (float('inf'), float('inf'))
             
-            year_match = re.search(r'\b(19|20)\d{2}\b', date_str)
+            year_match = self._year_re.search(date_str)
             year = int(year_match.group(0)) if year_match else 0
             
-            month_map = {
-                # English months
-                'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-                'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
-                # Hungarian months
-                'január': 1, 'február': 2, 'március': 3, 'április': 4, 'május': 5, 'június': 6,
-                'július': 7, 'augusztus': 8, 'szeptember': 9, 'október': 10, 'november': 11, 'december': 12,
-                # Short Hungarian months
-                'jan': 1, 'feb': 2, 'már': 3, 'ápr': 4, 'máj': 5, 'jún': 6,
-                'júl': 7, 'aug': 8, 'szept': 9, 'okt': 10, 'nov': 11, 'dec': 12
-            }
-            
-            month = 0
-            for month_str, month_num in month_map.items():
-                if month_str.lower() in date_str.lower():
-                    month = month_num
-                    break
+            month_matches = self._month_re.findall(date_lower)
+            month = min(self._month_rank[name] for name in month_matches)[1] if month_matches else 0
             
             return (year, month)
         except Exception as e:
-            print(f"Date parsing failed: {str(e)}")
+            logger.warning("Date parsing failed: %s", e)
             return (0, 0)
\ No newline at end of file
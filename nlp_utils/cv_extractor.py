@@ -0,0 +1,450 @@
+# Import extractors
+from .profile_extractor import ProfileExtractor
+from .education_extractor import EducationExtractor, _compile_keywords
+from .education_extractor_hu import EducationExtractorHu
+from .experience_extractor import ExperienceExtractor
+from .experience_extractor_hu import ExperienceExtractorHu
+from .skills_extractor import SkillsExtractor
+from .language_extractor import LanguageExtractor
+from .current_position_extractor import CurrentPositionExtractor
+from .cv_section_parser import CVSectionParser
+from .cv_section_parser_hu import CVSectionParserHu
+
+# Standard library imports
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+# Third-party imports
+import spacy
+import huspacy
+from spacy.tokens import Doc
+from langdetect import detect, LangDetectException
+from langdetect import detector_factory
+from langdetect.detector_factory import DetectorFactory, PROFILES_DIRECTORY
+
+logger = logging.getLogger(__name__)
+
+# Only English and Hungarian CVs are supported, so langdetect loads just these profiles;
+# anything else resolves to the closer of the two, which is how it is handled downstream
+DETECTOR_LANGUAGES = ('en', 'hu')
+
+def _init_detector_factory():
+    """Initialize the shared langdetect factory with the supported language profiles only."""
+    if detector_factory._factory is None:
+        profiles = []
+        for lang in DETECTOR_LANGUAGES:
+            with open(os.path.join(PROFILES_DIRECTORY, lang), 'r', encoding='utf-8') as f:
+                profiles.append(f.read())
+        factory = DetectorFactory()
+        factory.load_json_profile(profiles)
+        detector_factory._factory = factory
+
+detector_factory.init_factory = _init_detector_factory
+# Built at import so the worker threads never race to load the profiles on the first request
+_init_detector_factory()
+
+# Hungarian accented letters; their share of the letters decides clear-cut cases without langdetect
+_HU_CHAR_RE = re.compile(r'[áéíóöőúüűÁÉÍÓÖŐÚÜŰ]')
+_LETTER_RE = re.compile(r'[^\W\d_]')
+_LANGUAGE_SAMPLE_SIZE = 4000
+_HU_CHAR_RATIO = 0.05
+
+# Sentence boundaries for the per-sentence fallback; splitting after the punctuation keeps it and
+# leaves e-mail addresses, URLs and dotted dates in one piece
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# The whole-document pass only feeds entity and token lookups (profile and language extraction),
+# so the tagging and parsing components are skipped for it
+DOCUMENT_PASS_DISABLED = [
+    'tagger', 'parser', 'attribute_ruler', 'morphologizer', 'senter',
+    'experimental_arc_predicter', 'experimental_arc_labeler'
+]
+
+# Maximum number of documents kept in the per-extractor caches
+_CACHE_SIZE = 128
+
+class LazyModel:
+    """Load a spaCy pipeline on first use and forward calls and attributes to it."""
+
+    def __init__(self, loader, name: str, **kwargs):
+        self._loader = loader
+        self._name = name
+        self._kwargs = kwargs
+        self._nlp = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Return the loaded pipeline, loading it once if needed."""
+        if self._nlp is None:
+            with self._lock:
+                if self._nlp is None:
+                    self._nlp = self._loader(self._name, **self._kwargs)
+        return self._nlp
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+def _preload_model(model: LazyModel):
+    """Load a lazy model ahead of its first use, leaving the retry to that first use if it fails."""
+    try:
+        model.load()
+    except Exception as e:
+        logger.warning("Background load of %s failed: %s", model._name, e)
+
+# Load spaCy models; the extractors use entities, sentences, POS tags and dependencies but never lemmas,
+# so the lemmatizers are disabled along with the unused text classifiers.
+# The large Hungarian model loads in a background thread while English loads here, so neither
+# the import nor the first Hungarian CV waits for both; a CV arriving earlier blocks on the model's lock.
+nlp_hu = LazyModel(huspacy.load, 'hu_core_news_md', disable=["textcat", "textcat_multilingual", "lemmatizer", "lookup_lemmatizer", "trainable_lemmatizer"])
+threading.Thread(target=_preload_model, args=(nlp_hu,), name='hu-model-load', daemon=True).start()
+nlp_en = spacy.load('en_core_web_sm', disable=["textcat", "textcat_multilingual", "lemmatizer"])
+
+# Shared sub-extractors; they hold no per-document state, so every CVExtractor reuses them
+_profile_extractor = ProfileExtractor(nlp_en, nlp_hu)
+_education_extractor = EducationExtractor(nlp_en)
+_education_extractor_hu = EducationExtractorHu(nlp_hu)
+_experience_extractor = ExperienceExtractor(nlp_en)
+_experience_extractor_hu = ExperienceExtractorHu(nlp_hu)
+_skills_extractor = SkillsExtractor(nlp_en, nlp_hu)
+_language_extractor = LanguageExtractor(nlp_en, nlp_hu)
+_current_position_extractor = CurrentPositionExtractor(nlp_en, nlp_hu)
+
+# Shared pool for running the independent sub-extractors of a CV concurrently
+_extraction_executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix='cv-extract')
+
+class CVExtractor:
+    # Date extraction patterns
+    date_patterns = [
+        r'(?:Jan(?:uary)?|Feb(?:ruary)?|Ma(?:r(?:ch)?|y)|Ju(?:ne?|ly?)|'
+        r'A(?:pr(?:il)?|ug(?:ust)?)|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|'
+        r'Dec(?:ember)?)\s+\d{4}',
+        r'\d{1,2}/\d{1,2}/\d{2,4}',
+        r'\d{4}'
+    ]
+    _date_res = [re.compile(pattern, re.IGNORECASE) for pattern in date_patterns]
+
+    # Section headers for English and Hungarian
+    section_headers = {
+        'profile': ['profile', 'personal information', 'contact information', 'contact details', 'personal details', 'about me', 'summary'],
+        'education': ['education', 'academic background', 'qualifications', 'academic qualifications', 'tanulmányok', 'képzettség'],
+        'experience': ['experience', 'work experience', 'employment history', 'work history', 'professional experience', 'munkatapasztalat', 'szakmai tapasztalat'],
+        'skills': ['skills', 'technical skills', 'competencies', 'expertise', 'technologies', 'készségek', 'kompetenciák'],
+        'languages': ['language', 'languages', 'language skills', 'nyelvtudás', 'nyelvek'],
+    }
+
+    # Any known section header, used to detect where a section ends
+    _any_header_re = _compile_keywords(tuple(
+        keyword for keywords in section_headers.values() for keyword in keywords
+    ))
+
+    def __init__(self):
+        """Initialize CVExtractor with all necessary extractors and parsers."""
+        # Initialize extractors
+        self.profile_extractor = _profile_extractor
+        self.education_extractor = _education_extractor
+        self.education_extractor_hu = _education_extractor_hu
+        self.experience_extractor = _experience_extractor
+        self.experience_extractor_hu = _experience_extractor_hu
+        self.skills_extractor = _skills_extractor
+        self.language_extractor = _language_extractor
+        self.current_position_extractor = _current_position_extractor
+        self.section_parser = CVSectionParser()
+        self.section_parser_hu = CVSectionParserHu()
+
+        # Language-specific extractors; any other language uses the English one
+        self._education_by_language = {'hu': self.education_extractor_hu}
+        self._experience_by_language = {'hu': self.experience_extractor_hu}
+
+        # Cache for parsed sections
+        self._section_cache = OrderedDict()
+        self._lang_cache = OrderedDict()
+
+    # MAIN EXTRACTION METHODS
+    def extract_entities(self, text: str, doc=None, language: Optional[str] = None) -> Dict:
+        """Main method to extract all information from CV, optionally reusing an already processed Doc."""
+        if language is None:
+            language = self._detect_language(text)
+        
+        parsed_sections = self._get_parsed_sections(text, language)
+        if doc is None:
+            nlp_model = self.get_nlp_model_for_text(text, language)
+            doc = self.safe_nlp_process(text, nlp_model, DOCUMENT_PASS_DISABLED)
+        
+        # Sections are parsed once above and handed to every extractor, which only read them
+        profile_future = _extraction_executor.submit(self.profile_extractor.extract_profile, text, doc=doc)
+        education_future = _extraction_executor.submit(self.extract_education, text, language, parsed_sections)
+        experience_future = _extraction_executor.submit(self.extract_work_experience, text, language, parsed_sections)
+        skills_future = _extraction_executor.submit(self.extract_skills, text, parsed_sections)
+        languages_future = _extraction_executor.submit(self.extract_languages, text, doc, parsed_sections)
+        
+        profile_data = profile_future.result()
+        education = education_future.result()
+        experience = experience_future.result()
+        current_position = self._current_position_from_experience(text, experience)
+        skills = skills_future.result()
+        languages = languages_future.result()
+        
+        return {
+            "language": language,
+            "profile": profile_data,
+            "current_position": current_position,
+            "education": education,
+            "experience": experience,
+            "skills": skills,
+            "languages": languages
+        }
+
+    def extract_entities_batch(self, texts: List[str], batch_size: int = 32) -> List[Dict]:
+        """Extract information from several CVs, running each language's texts through spaCy in batches."""
+        languages = [self._detect_language(text) for text in texts]
+        models = [self.get_nlp_model_for_text(text, language) for text, language in zip(texts, languages)]
+        docs = [None] * len(texts)
+
+        for nlp in (nlp_en, nlp_hu):
+            indices = [i for i, model in enumerate(models) if model is nlp]
+            if not indices:
+                continue
+            try:
+                for i, doc in zip(indices, nlp.pipe((texts[i] for i in indices), batch_size=batch_size, disable=DOCUMENT_PASS_DISABLED)):
+                    docs[i] = doc
+            except Exception as e:
+                logger.warning("Batch processing failed, processing documents individually: %s", e)
+                for i in indices:
+                    docs[i] = self.safe_nlp_process(texts[i], nlp, DOCUMENT_PASS_DISABLED)
+
+        return [self.extract_entities(text, doc, language) for text, doc, language in zip(texts, docs, languages)]
+
+    def extract_work_experience(self, text: str, language: Optional[str] = None, parsed_sections: Optional[Dict] = None) -> List[Dict]:
+        """Extract detailed work experience information using the appropriate ExperienceExtractor."""
+        try:
+            if language is None:
+                language = self._detect_language(text)
+            if parsed_sections is None:
+                parsed_sections = self._get_parsed_sections(text, language)
+            experience_sections = parsed_sections.get('experience') if parsed_sections else None
+            parsed_data = {'experience': experience_sections} if experience_sections else None
+
+            extractor = self._experience_by_language.get(language, self.experience_extractor)
+            return extractor.extract_work_experience(text, parsed_data)
+
+        except Exception as e:
+            logger.error("Error extracting work experience: %s", e)
+            return []
+
+    def extract_current_position(self, text: str, language: Optional[str] = None) -> Optional[str]:
+        """Extract the most recent job title using CurrentPositionExtractor."""
+        work_experience = self.extract_work_experience(text, language)
+        return self._current_position_from_experience(text, work_experience)
+
+    def extract_education(self, text: str, language: Optional[str] = None, parsed_sections: Optional[Dict] = None) -> List[Dict]:
+        """Extract education information from text."""
+        try:
+            if language is None:
+                language = self._detect_language(text)
+            if parsed_sections is None:
+                parsed_sections = self._get_parsed_sections(text, language)
+
+            extractor = self._education_by_language.get(language, self.education_extractor)
+            return extractor.extract_education(text, parsed_sections)
+
+        except Exception as e:
+            logger.warning("Education extraction failed: %s", e)
+            return []
+
+    def extract_skills(self, text: str, parsed_sections: Optional[Dict] = None) -> List[str]:
+        """Extract skills from text using SkillsExtractor."""
+        try:
+            if parsed_sections is None:
+                parsed_sections = self._get_parsed_sections(text)
+            return self.skills_extractor.extract_skills(text, parsed_sections)
+            
+        except Exception as e:
+            logger.error("Error extracting skills: %s", e)
+            return []
+
+    def extract_languages(self, text: str, doc=None, parsed_sections: Optional[Dict] = None) -> List[Dict[str, str]]:
+        """Extract languages and their proficiency levels using LanguageExtractor."""
+        try:
+            if parsed_sections is None:
+                parsed_sections = self._get_parsed_sections(text)
+            return self.language_extractor.extract_languages(text, parsed_sections, doc)
+            
+        except Exception as e:
+            logger.error("Error extracting languages: %s", e)
+            return [{'language': '', 'proficiency': ''}]
+
+    def extract_profile(self, text: str, doc=None) -> Dict[str, str]:
+        """Extract profile information using ProfileExtractor."""
+        try:
+            parsed_sections = self._get_parsed_sections(text)
+            return self.profile_extractor.extract_profile(text, parsed_sections, doc)
+            
+        except Exception as e:
+            logger.error("Error extracting profile: %s", e)
+            return {
+                'name': "",
+                'email': "",
+                'phone': "",
+                'location': "",
+                'url': "",
+                'summary': ""
+            }
+
+    # HELPER METHODS
+    def _current_position_from_experience(self, text: str, work_experience: List[Dict]) -> Optional[str]:
+        """Pick the current position from already extracted work experience."""
+        return self.current_position_extractor.extract_current_position(text, work_experience)
+
+    def _get_parsed_sections(self, text: str, language: Optional[str] = None) -> Dict[str, List[str]]:
+        """Get or create parsed sections for the given text."""
+        text_key = self._cache_key(text)
+        cached = self._section_cache.get(text_key)
+        if cached is not None:
+            return cached
+
+        try:
+            if language is None:
+                language = self._detect_language(text)
+            if language == 'hu':
+                parsed_sections = self.section_parser_hu.parse_sections(text)
+            else:
+                parsed_sections = self.section_parser.parse_sections(text)
+        except:
+            parsed_sections = self.section_parser.parse_sections(text)
+
+        self._cache_store(self._section_cache, text_key, parsed_sections)
+        return parsed_sections
+
+    def _detect_language(self, text: str) -> str:
+        """Detect the language of the text once and reuse it for repeated lookups."""
+        text_key = self._cache_key(text)
+        cached = self._lang_cache.get(text_key)
+        if cached is not None:
+            return cached
+
+        sample = text[:_LANGUAGE_SAMPLE_SIZE]
+        hu_chars = len(_HU_CHAR_RE.findall(sample))
+        if hu_chars == 0 and sample.isascii():
+            language = 'en'
+        elif hu_chars >= 3 and hu_chars >= _HU_CHAR_RATIO * len(_LETTER_RE.findall(sample)):
+            language = 'hu'
+        else:
+            try:
+                language = detect(text)
+            except LangDetectException:
+                language = 'en'
+
+        self._cache_store(self._lang_cache, text_key, language)
+        return language
+
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """Build a collision-resistant cache key from the text content."""
+        return hashlib.blake2b(text.encode('utf-8', errors='surrogatepass'), digest_size=16).digest()
+
+    @staticmethod
+    def _cache_store(cache: OrderedDict, key: bytes, value) -> None:
+        """Store a value in a bounded cache, evicting the oldest entries first."""
+        cache[key] = value
+        while len(cache) > _CACHE_SIZE:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                break
+
+    def get_nlp_model_for_text(self, text: str, language: Optional[str] = None):
+        """Return the spaCy NLP model for the text, detecting its language unless it is given."""
+        try:
+            if language is None:
+                language = self._detect_language(text)
+            if language == 'hu' and _HU_CHAR_RE.search(text):
+                try:
+                    sample = text[:100].encode('utf-8', errors='ignore').decode('utf-8')
+                    _ = nlp_hu(sample)
+                    return nlp_hu
+                except Exception as e:
+                    logger.warning("Hungarian model failed, falling back to English: %s", e)
+                    return nlp_en
+            return nlp_en
+        except Exception as e:
+            logger.warning("Language detection failed, using English model: %s", e)
+            return nlp_en
+
+    def safe_nlp_process(self, text: str, nlp_model, disable: Optional[List[str]] = None):
+        """Safely process text with NLP model, handling potential vocabulary issues."""
+        disable = disable or []
+        if len(text) <= nlp_model.max_length:
+            try:
+                return nlp_model(text, disable=disable)
+            except Exception as e:
+                if "Can't retrieve string for hash" not in str(e):
+                    return nlp_en(text, disable=disable)
+
+        # Texts over the model's length limit, or hitting vocabulary errors, are processed per sentence
+        processed_docs = self._process_sentences(text, nlp_model, disable)
+        if processed_docs:
+            return Doc.from_docs(processed_docs)
+
+        return nlp_en(text, disable=disable)
+
+    def _process_sentences(self, text: str, nlp_model, disable: List[str]) -> List:
+        """Process sentences in a batch, retrying one by one to skip any sentence that fails."""
+        sentences = [sentence.strip() for sentence in _SENTENCE_SPLIT_RE.split(text) if sentence.strip()]
+        try:
+            return list(nlp_model.pipe(sentences, batch_size=64, disable=disable))
+        except Exception:
+            processed_docs = []
+            for sentence in sentences:
+                try:
+                    processed_docs.append(nlp_model(sentence, disable=disable))
+                except Exception as sent_error:
+                    logger.warning("Skipping sentence due to error: %s", sent_error)
+            return processed_docs
+
+    def extract_dates(self, text: str) -> List[str]:
+        """Extract dates from text using various patterns."""
+        return list(dict.fromkeys(date for date_re in self._date_res for date in date_re.findall(text)))
+
+    def extract_section_with_language_detection(self, text: str, section_keywords: List[str]) -> List[str]:
+        """Extract the entries of a specific section, split on blank lines and section headers."""
+        entries = []
+        lines = text.split('\n')
+        in_section = False
+        current_entry = []
+        section_re = _compile_keywords(tuple(section_keywords))
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                if current_entry:
+                    entries.append(' '.join(current_entry))
+                    current_entry = []
+                continue
+
+            line_lower = line.lower()
+            if section_re.search(line_lower):
+                in_section = True
+                continue
+            elif self._any_header_re.search(line_lower):
+                in_section = False
+                if current_entry:
+                    entries.append(' '.join(current_entry))
+                    current_entry = []
+                continue
+
+            if in_section:
+                current_entry.append(line)
+
+        if current_entry:
+            entries.append(' '.join(current_entry))
+
+        return entries
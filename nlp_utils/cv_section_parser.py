@@ -1,12 +1,38 @@
 import re
 import spacy
 import logging
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _combine_patterns(patterns: List[str]) -> re.Pattern:
+    """Fuse case-insensitive patterns into one alternation that matches wherever any of them does."""
+    return re.compile('|'.join(f'(?:{pattern.removeprefix("(?i)")})' for pattern in patterns), re.IGNORECASE)
+
+class _KeywordSet:
+    """Find which of a set of lowercase keywords occur in a lowercased text with a single regex scan."""
+
+    def __init__(self, keywords):
+        # The lookahead reports the longest keyword starting at every position, overlaps included;
+        # shorter keywords hidden behind it at that position are exactly its prefixes
+        ordered = sorted(keywords, key=len, reverse=True)
+        self._re = re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))')
+        self._prefixes = {keyword: {other for other in keywords if keyword.startswith(other)} for keyword in keywords}
+
+    def count(self, text_lower: str) -> int:
+        """Return how many distinct keywords occur in the text."""
+        found = set()
+        for keyword in self._re.findall(text_lower):
+            found |= self._prefixes[keyword]
+        return len(found)
+
+def _parse_in_worker(text: str) -> Dict[str, List[str]]:
+    """Parse one CV in a worker process with that process's parser instance."""
+    return CVSectionParser().parse_sections(text)
+
 class CVSectionParser:
     _instance = None
 
@@ -22,6 +48,7 @@ class CVSectionParser:
             self.initialized = True
             self._init_patterns()
             self.current_text = ""
+            self.current_lines = []
             try:
                 self.model = spacy.load("models/textcat_model/model-best")
                 logger.info("Loaded English text classification model")
@@ -52,6 +79,15 @@ class CVSectionParser:
             logger.error(f"Error parsing sections: {str(e)}")
             return {}
 
+    def parse_many(self, texts: List[str], max_workers: Optional[int] = None) -> List[Dict[str, List[str]]]:
+        """Parse several CVs in parallel worker processes, returning results in input order."""
+        if len(texts) < 2:
+            return [self.parse_sections(text) for text in texts]
+
+        # Each worker builds its own singleton once, so patterns compile once per process
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=CVSectionParser) as executor:
+            return list(executor.map(_parse_in_worker, texts, chunksize=8))
+
     def detect_sections(self, text: str) -> Dict[str, List[str]]:
         """Main method to detect and extract sections from CV text."""
         if not text:
@@ -59,6 +95,8 @@ class CVSectionParser:
         
         logger.info("Starting CV parsing...")
         self.current_text = text
+        # Split once per document; every summary/profile header looks ahead in these lines
+        self.current_lines = text.split('\n')
         text = self._preprocess_text(text)
         
         sections = {
@@ -175,6 +213,17 @@ class CVSectionParser:
             'knowledge', 'skills', 'expertise', 'competencies', 'stack', 'technical'
         }
         
+        # Word lists for the capitalized-header heuristic in _is_likely_new_section
+        self.common_starters = frozenset({'i', 'we', 'they', 'he', 'she', 'it', 'the', 'a', 'an', 'my', 'our', 'your'})
+        
+        self.common_header_words = frozenset({
+            'summary', 'profile', 'experience', 'education', 'skills',
+            'projects', 'achievements', 'certifications', 'publications',
+            'awards', 'interests', 'references', 'contact', 'personal',
+            'work', 'employment', 'qualification', 'objective', 'about', 'work experience',
+            'languages', 'expertise', 'professional'
+        })
+        
         self.experience_indicators = [
             r'(?i)(20\d{2}\s*-\s*(20\d{2}|present|current))',
             r'(?i)(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}',
@@ -271,43 +320,83 @@ class CVSectionParser:
             }
         }
 
+        # Date formats that rule a line out as a header, and those that mark a natural separator
+        self.new_section_date_patterns = [
+            r"(?i)(19|20)\d{2}\s*[-–]\s*((19|20)\d{2}|present|current)",
+            r"(?i)^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}",
+            r"(?i)\d{1,2}/\d{4}",
+            r"(?i)\d{1,2}\.\d{4}",
+            r"(?i)\d{4}\s*[-–]\s*(?:Present|Current|Now|\d{4})",
+            r"(?i)(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*[-–]",
+            r"(?i)\d{2}/\d{4}\s*[-–]"
+        ]
+        self.separator_date_patterns = [
+            r'(?i)\d{4}\s*[-–]\s*(?:Present|Current|Now|\d{4})',
+            r'(?i)(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*[-–]',
+            r'(?i)\d{2}/\d{4}\s*[-–]',
+            r'(?i)\d{1,2}\.\d{4}',
+            r'(?i)\d{1,2}/\d{4}'
+        ]
+
+        # One scan per line instead of one per pattern; each header group is named after its section,
+        # and alternatives are tried in order, so the first section that matches wins as before
+        self._section_header_re = re.compile('|'.join(
+            f'(?P<{section}>{_combine_patterns(patterns).pattern})'
+            for section, patterns in self.section_headers.items()
+        ), re.IGNORECASE)
+        self._experience_re = _combine_patterns(self.experience_indicators)
+        self._language_name_re = _combine_patterns(self.language_patterns['languages'])
+        self._proficiency_re = _combine_patterns(self.language_patterns['proficiency_levels'])
+        self._language_section_re = _combine_patterns(self.language_patterns['section_indicators'])
+        self._new_section_date_re = _combine_patterns(self.new_section_date_patterns)
+        self._separator_date_re = _combine_patterns(self.separator_date_patterns)
+        # Plain substring alternation, matching the old per-keyword 'in' test
+        self._tech_keyword_re = re.compile('|'.join(re.escape(keyword) for keyword in sorted(self.tech_keywords)))
+
+        # Content-type scoring counts individual pattern and keyword hits, so those stay separate
+        for indicators in self.section_content_indicators.values():
+            for key in ('patterns', 'negative_patterns'):
+                if key in indicators:
+                    indicators[key] = [re.compile(pattern) for pattern in indicators[key]]
+            indicators['keyword_set'] = _KeywordSet(indicators['keywords'])
+
+        self._language_format_re = re.compile(
+            r'(?i)\b(english|german|french|spanish|hungarian|chinese|japanese|korean|arabic|russian|italian|portuguese|dutch|magyar|angol|német|francia|spanyol)\b[\s\-:]+\b(native|fluent|advanced|intermediate|basic|beginner|c1|c2|b1|b2|a1|a2)\b'
+        )
+        self._column_gap_re = re.compile(r'\s{3,}|\t+')
+        # Whole lines holding a column gap; every other line passes through the substitution untouched
+        self._column_line_re = re.compile(r'^.*(?:[^\S\n]{3,}|\t).*$', re.MULTILINE)
+        self._blank_lines_re = re.compile(r'\n\s*\n')
+        self._whitespace_re = re.compile(r'\s+')
+
     # Section identification methods
     def _identify_section_header(self, line: str, found_sections: set) -> str:
         """Identify if a line is a section header using pattern matching."""
         line = line.strip()
-        if not line or len(line.split()) > 5:
+        # maxsplit stops splitting after the sixth word, so long body lines are rejected without a full split
+        if not line or len(line.split(maxsplit=5)) > 5:
             return None
         
-        for section, patterns in self.section_headers.items():
-            for pattern in patterns:
-                if re.match(pattern, line):
-                    if section in ['summary', 'profile']:
-                        next_lines = self._get_next_content_lines(line, max_lines=3)
-                        if next_lines:
-                            detected_type = self._detect_section_content_type('\n'.join(next_lines))
-                            found_sections.add(detected_type)
-                            return detected_type
-                    found_sections.add(section)
-                    return section
-                    
-        return None
+        match = self._section_header_re.match(line)
+        if not match:
+            return None
+
+        section = match.lastgroup
+        if section in ['summary', 'profile']:
+            next_lines = self._get_next_content_lines(line, max_lines=3)
+            if next_lines:
+                detected_type = self._detect_section_content_type('\n'.join(next_lines))
+                found_sections.add(detected_type)
+                return detected_type
+        found_sections.add(section)
+        return section
 
     def _is_likely_new_section(self, line: str) -> bool:
         """Enhanced check if a line is likely to be a new section header."""
         if not line.strip():
             return False
             
-        date_patterns = [
-            r"(?i)(19|20)\d{2}\s*[-–]\s*((19|20)\d{2}|present|current)",
-            r"(?i)^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}",
-            r"(?i)\d{1,2}/\d{4}",
-            r"(?i)\d{1,2}\.\d{4}",
-            r"(?i)\d{4}\s*[-–]\s*(?:Present|Current|Now|\d{4})",
-            r"(?i)(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*[-–]",
-            r"(?i)\d{2}/\d{4}\s*[-–]"
-        ]
-        
-        if any(re.search(pattern, line) for pattern in date_patterns):
+        if self._new_section_date_re.search(line):
             return False
             
         if line.strip().startswith(('•', '-', '•', '○', '●', '*', '→', '▪', '◦')):
@@ -319,34 +408,17 @@ class CVSectionParser:
             
         words = line.split()
         if 1 <= len(words) <= 5:
-            common_starters = {'i', 'we', 'they', 'he', 'she', 'it', 'the', 'a', 'an', 'my', 'our', 'your'}
             first_word = words[0].lower()
             
-            common_header_words = {
-                'summary', 'profile', 'experience', 'education', 'skills',
-                'projects', 'achievements', 'certifications', 'publications',
-                'awards', 'interests', 'references', 'contact', 'personal',
-                'work', 'employment', 'qualification', 'objective', 'about', 'work experience',
-                'languages', 'expertise', 'professional'
-            }
-            
-            if (words[0][0].isupper() and first_word not in common_starters and
-                any(word.lower() in common_header_words for word in words)):
+            if (words[0][0].isupper() and first_word not in self.common_starters and
+                any(word.lower() in self.common_header_words for word in words)):
                 return True
             
         return False
 
     def _is_likely_separator(self, line: str, next_line: str = "") -> bool:
         """Check if a line is likely a natural separator in the CV."""
-        date_patterns = [
-            r'\d{4}\s*[-–]\s*(?:Present|Current|Now|\d{4})',
-            r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*[-–]',
-            r'\d{2}/\d{4}\s*[-–]',
-            r'\d{1,2}\.\d{4}',
-            r'\d{1,2}/\d{4}'
-        ]
-        
-        if any(re.search(pattern, line, re.IGNORECASE) for pattern in date_patterns):
+        if self._separator_date_re.search(line):
             return True
         
         if line.strip().startswith(('•', '-', '*', '▪', '◦', '○', '●', '→')):
@@ -366,37 +438,32 @@ class CVSectionParser:
         """Detect the type of content in a section."""
         text_lower = text.lower()
         
-        if any(re.search(pattern, text) for pattern in self.section_content_indicators["summary"]["negative_patterns"]):
+        if any(pattern.search(text) for pattern in self.section_content_indicators["summary"]["negative_patterns"]):
             return "profile"
             
         summary_score = 0
         profile_score = 0
         
-        summary_score += sum(1 for word in self.section_content_indicators["summary"]["keywords"] 
-                           if word in text_lower) * 2
-        profile_score += sum(1 for word in self.section_content_indicators["profile"]["keywords"] 
-                           if word in text_lower) * 1.5
+        summary_score += self.section_content_indicators["summary"]["keyword_set"].count(text_lower) * 2
+        profile_score += self.section_content_indicators["profile"]["keyword_set"].count(text_lower) * 1.5
         
         summary_score += sum(1 for pattern in self.section_content_indicators["summary"]["patterns"] 
-                           if re.search(pattern, text)) * 2
+                           if pattern.search(text)) * 2
         profile_score += sum(1 for pattern in self.section_content_indicators["profile"]["patterns"] 
-                           if re.search(pattern, text)) * 2
+                           if pattern.search(text)) * 2
         
-        if len(text.split()) > 30 and not any(re.search(pattern, text) 
+        if len(text.split()) > 30 and not any(pattern.search(text) 
             for pattern in self.section_content_indicators["summary"]["negative_patterns"]):
             summary_score += 3
             
-        if any(re.search(pattern, text) for pattern in self.experience_indicators):
+        if self._experience_re.search(text):
             summary_score -= 2
             
         return "summary" if summary_score > profile_score else "profile"
 
     def _contains_language_info(self, text: str) -> bool:
         """Check if text contains language-related information."""
-        has_section_indicator = any(
-            re.search(pattern, text, re.IGNORECASE) 
-            for pattern in self.language_patterns['section_indicators']
-        )
+        has_section_indicator = self._language_section_re.search(text)
         
         if not has_section_indicator:
             return False
@@ -406,58 +473,40 @@ class CVSectionParser:
 
     def _is_language_line(self, text: str) -> bool:
         """Check if a line contains language information."""
-        has_language_name = any(re.search(pattern, text.lower()) for pattern in self.language_patterns['languages'])
-        has_proficiency = any(re.search(pattern, text.lower()) for pattern in self.language_patterns['proficiency_levels'])
-        is_short = len(text.split()) <= 12
-        has_work_exp = any(re.search(pattern, text, re.IGNORECASE) for pattern in self.experience_indicators)
-        has_tech_terms = any(keyword in text.lower() for keyword in self.tech_keywords)
-        
-        typical_format = bool(re.search(
-            r'(?i)\b(english|german|french|spanish|hungarian|chinese|japanese|korean|arabic|russian|italian|portuguese|dutch|magyar|angol|német|francia|spanyol)\b[\s\-:]+\b(native|fluent|advanced|intermediate|basic|beginner|c1|c2|b1|b2|a1|a2)\b',
-            text
-        ))
-        
+        # All conditions must hold, so test the cheap word count and the rarest pattern first and stop at
+        # the first failure; the combined patterns are case-insensitive, only the keyword test lowercases
         return (
-            has_language_name 
-            and has_proficiency 
-            and is_short 
-            and not has_work_exp 
-            and not has_tech_terms
-            and typical_format
+            len(text.split()) <= 12
+            and bool(self._language_format_re.search(text))
+            and bool(self._language_name_re.search(text))
+            and bool(self._proficiency_re.search(text))
+            and not self._experience_re.search(text)
+            and not self._tech_keyword_re.search(text.lower())
         )
 
     # Text processing methods
     def _preprocess_text(self, text: str) -> str:
         """Preprocess text to handle two-column layouts."""
-        lines = text.split('\n')
-        processed_lines = []
-        
-        for line in lines:
-            if not line.strip():
-                processed_lines.append(line)
-                continue
-            
-            splits = re.split(r'\s{3,}|\t+', line)
-            if len(splits) > 1:
-                for split in splits:
-                    if split.strip():
-                        processed_lines.append(split.strip())
-            else:
-                processed_lines.append(line)
-        
-        return '\n'.join(processed_lines)
+        return self._column_line_re.sub(self._split_columns, text)
+
+    def _split_columns(self, match: re.Match) -> str:
+        """Put each column of a two-column line on its own line."""
+        line = match.group(0)
+        if not line.strip():
+            return line
+        return '\n'.join(split.strip() for split in self._column_gap_re.split(line) if split.strip())
 
     def _clean_content(self, content: str) -> str:
         """Clean and normalize content."""
-        content = re.sub(r'\n\s*\n', '\n', content)
-        content = re.sub(r'\s+', ' ', content)
+        content = self._blank_lines_re.sub('\n', content)
+        content = self._whitespace_re.sub(' ', content)
         return content.strip()
 
     def _get_next_content_lines(self, current_line: str, max_lines: int = 3) -> List[str]:
         """Get the next few non-empty content lines after the current line."""
         lines = []
         current_idx = 0
-        text_lines = self.current_text.split('\n')
+        text_lines = self.current_lines
         
         for i, line in enumerate(text_lines):
             if line.strip() == current_line.strip():
@@ -499,9 +548,9 @@ class CVSectionParser:
         """Process a block of text to determine if it's language or work experience content."""
         block_text = ' '.join(block)
         
-        has_language = any(re.search(pattern, block_text) for pattern in self.language_patterns['languages'])
-        has_proficiency = any(re.search(pattern, block_text) for pattern in self.language_patterns['proficiency_levels'])
-        has_work_exp = any(re.search(pattern, block_text) for pattern in self.experience_indicators)
+        has_language = self._language_name_re.search(block_text)
+        has_proficiency = self._proficiency_re.search(block_text)
+        has_work_exp = self._experience_re.search(block_text)
         
         if has_language and has_proficiency and len(block_text.split()) <= 8:
             language_lines.extend(block)
@@ -527,10 +576,6 @@ class CVSectionParser:
         )
 
     # Model-related methods
-    def _wait_for_model(self):
-        """Wait for the model to be ready."""
-        pass
-
     def _classify_text_with_model(self, text: str) -> Dict[str, float]:
         """Classify text using the spaCy model."""
         if not self.model:
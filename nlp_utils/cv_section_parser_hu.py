@@ -3,6 +3,8 @@ import re
 import fasttext
 from typing import Dict, List
 
+from .cv_section_parser import _KeywordSet, _combine_patterns
+
 # Configure logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -107,6 +109,9 @@ class CVSectionParserHu:
             'ismeret', 'készségek', 'szakértelem', 'kompetenciák', 'technikai'
         }
         
+        # Every bullet marker is a single character, so a set lookup on the first one replaces startswith
+        self.bullet_chars = frozenset('•-○●*→▪◦')
+        
         self.experience_indicators = [
             r'(?i)(20\d{2}\s*-\s*(20\d{2}|jelenleg|jelenlegi))',
             r'(?i)(jan|feb|már|ápr|máj|jún|júl|aug|szep|okt|nov|dec)\s*\d{4}',
@@ -206,43 +211,80 @@ class CVSectionParserHu:
             }
         }
 
+        # Date formats that rule a line out as a header
+        self.new_section_date_patterns = [
+            r"(?i)(19|20)\d{2}\s*[-–]\s*((19|20)\d{2}|jelenleg|jelenlegi)",
+            r"(?i)^(jan|feb|már|ápr|máj|jún|júl|aug|szep|okt|nov|dec)\s*\d{4}",
+            r"(?i)\d{1,2}/\d{4}",
+            r"(?i)\d{1,2}\.\d{4}"
+        ]
+
+        # The parser is a singleton, so every pattern is compiled exactly once, here
+        self.language_patterns = {
+            name: [re.compile(pattern) for pattern in patterns]
+            for name, patterns in self.language_patterns.items()
+        }
+        self.experience_indicators = [re.compile(pattern) for pattern in self.experience_indicators]
+        for indicators in self.section_content_indicators.values():
+            for key in ('patterns', 'negative_patterns'):
+                if key in indicators:
+                    indicators[key] = [re.compile(pattern) for pattern in indicators[key]]
+            indicators['keyword_set'] = _KeywordSet(indicators['keywords'])
+        self._tech_keyword_re = re.compile('|'.join(re.escape(keyword) for keyword in sorted(self.tech_keywords)))
+
+        # Built the same way as the English parser's header regex
+        self._section_header_re = re.compile('|'.join(
+            f'(?P<{section}>{_combine_patterns(patterns).pattern})'
+            for section, patterns in self.section_headers.items()
+        ), re.IGNORECASE)
+        self._new_section_date_re = _combine_patterns(self.new_section_date_patterns)
+        # Every date format needs a digit, and a lone digit search is far cheaper than the fused dates
+        self._digit_re = re.compile(r'\d')
+
+        self._first_person_re = re.compile(r"(?i)^[^.]{10,}(vagyok|dolgozom)\b")
+        self._language_format_re = re.compile(
+            r'(?i)\b(magyar|angol|német|francia|spanyol|olasz|orosz)\b[\s\-:]+\b(anyanyelv|folyékony|haladó|középszint|alapszint|kezdő|c1|c2|b1|b2|a1|a2)\b'
+        )
+        self._extra_blank_lines_re = re.compile(r'\n\s*\n\s*\n+')
+        self._inline_space_re = re.compile(r'[^\S\n]+')
+        self._bullet_prefix_re = re.compile(r'^[•\-●○▪◦→\*]\s*')
+        self._blank_lines_re = re.compile(r'\n\s*\n')
+        self._whitespace_re = re.compile(r'\s+')
+        self._model_strip_re = re.compile(r'[^a-zA-Z0-9áéíóöőúüűÁÉÍÓÖŐÚÜŰ\s\-]')
+        self._model_hyphen_re = re.compile(r'(\w)\s*-\s*(\w)')
+
     # Section identification methods
     def _identify_section_header(self, line: str, found_sections: set) -> str:
         """Identify if a line is a section header using pattern matching."""
         line = line.strip()
-        if not line or len(line.split()) > 5:
+        # Preprocessing leaves single spaces between words, so the space count gives the word count
+        if not line or line.count(' ') > 4:
             return None
         
-        for section, patterns in self.section_headers.items():
-            for pattern in patterns:
-                if re.match(pattern, line):
-                    if section in ['summary', 'profile']:
-                        next_lines = self._get_next_content_lines(line, max_lines=3)
-                        if next_lines:
-                            detected_type = self._detect_section_content_type('\n'.join(next_lines))
-                            found_sections.add(detected_type)
-                            return detected_type
-                    found_sections.add(section)
-                    return section
-                    
-        return None
+        match = self._section_header_re.match(line)
+        if not match:
+            return None
+
+        section = match.lastgroup
+        if section in ['summary', 'profile']:
+            next_lines = self._get_next_content_lines(line, max_lines=3)
+            if next_lines:
+                detected_type = self._detect_section_content_type('\n'.join(next_lines))
+                found_sections.add(detected_type)
+                return detected_type
+        found_sections.add(section)
+        return section
 
     def _is_likely_new_section(self, line: str) -> bool:
         """Check if a line is likely to be a new section header."""
-        if not line.strip():
+        stripped = line.strip()
+        if not stripped:
             return False
             
-        date_patterns = [
-            r"(?i)(19|20)\d{2}\s*[-–]\s*((19|20)\d{2}|jelenleg|jelenlegi)",
-            r"(?i)^(jan|feb|már|ápr|máj|jún|júl|aug|szep|okt|nov|dec)\s*\d{4}",
-            r"(?i)\d{1,2}/\d{4}",
-            r"(?i)\d{1,2}\.\d{4}"
-        ]
-        
-        if any(re.search(pattern, line) for pattern in date_patterns):
+        if self._digit_re.search(line) and self._new_section_date_re.search(line):
             return False
             
-        if line.strip().startswith(('•', '-', '•', '○', '●', '*', '→', '▪', '◦')):
+        if stripped[0] in self.bullet_chars:
             return False
             
         if (line.isupper() and len(line.split()) <= 4 and 
@@ -281,30 +323,28 @@ class CVSectionParserHu:
         
         text_lower = text.lower()
         
-        if any(re.search(pattern, text) for pattern in self.section_content_indicators["summary"]["negative_patterns"]):
+        if any(pattern.search(text) for pattern in self.section_content_indicators["summary"]["negative_patterns"]):
             return "profile"
         
-        first_line = text.split('\n')[0].strip().lower()
-        if any(keyword in first_line for keyword in self.section_content_indicators["profile"]["keywords"]):
+        first_line = text_lower.split('\n', 1)[0].strip()
+        if self.section_content_indicators["profile"]["keyword_set"].count(first_line):
             return "profile"
         
-        if re.match(r"(?i)^[^.]{10,}(vagyok|dolgozom)\b", text):
+        if self._first_person_re.match(text):
             return "summary"
         
         summary_score = 0
         profile_score = 0
         
-        summary_score += sum(2 for word in self.section_content_indicators["summary"]["keywords"] 
-                            if word in text_lower)
-        profile_score += sum(1.5 for word in self.section_content_indicators["profile"]["keywords"] 
-                            if word in text_lower)
+        summary_score += self.section_content_indicators["summary"]["keyword_set"].count(text_lower) * 2
+        profile_score += self.section_content_indicators["profile"]["keyword_set"].count(text_lower) * 1.5
         
         summary_score += sum(2 for pattern in self.section_content_indicators["summary"]["patterns"] 
-                            if re.search(pattern, text))
+                            if pattern.search(text))
         profile_score += sum(2 for pattern in self.section_content_indicators["profile"]["patterns"] 
-                            if re.search(pattern, text))
+                            if pattern.search(text))
         
-        if len(text.split()) > 20 and not any(re.search(pattern, text) 
+        if len(text.split()) > 20 and not any(pattern.search(text) 
             for pattern in self.section_content_indicators["summary"]["negative_patterns"]):
             summary_score += 3
         
@@ -312,16 +352,14 @@ class CVSectionParserHu:
 
     def _is_language_line(self, text: str) -> bool:
         """Check if a line contains language information."""
-        has_language_name = any(re.search(pattern, text.lower()) for pattern in self.language_patterns['languages'])
-        has_proficiency = any(re.search(pattern, text.lower()) for pattern in self.language_patterns['proficiency_levels'])
+        text_lower = text.lower()
+        has_language_name = any(pattern.search(text_lower) for pattern in self.language_patterns['languages'])
+        has_proficiency = any(pattern.search(text_lower) for pattern in self.language_patterns['proficiency_levels'])
         is_short = len(text.split()) <= 12
-        has_work_exp = any(re.search(pattern, text, re.IGNORECASE) for pattern in self.experience_indicators)
-        has_tech_terms = any(keyword in text.lower() for keyword in self.tech_keywords)
+        has_work_exp = any(pattern.search(text) for pattern in self.experience_indicators)
+        has_tech_terms = bool(self._tech_keyword_re.search(text_lower))
         
-        typical_format = bool(re.search(
-            r'(?i)\b(magyar|angol|német|francia|spanyol|olasz|orosz)\b[\s\-:]+\b(anyanyelv|folyékony|haladó|középszint|alapszint|kezdő|c1|c2|b1|b2|a1|a2)\b',
-            text
-        ))
+        typical_format = bool(self._language_format_re.search(text))
         
         return (
             has_language_name 
@@ -338,9 +376,9 @@ class CVSectionParserHu:
         if not text:
             return ""
         
-        text = re.sub(r'\r', '\n', text)
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-        text = re.sub(r'[^\S\n]+', ' ', text)
+        text = text.replace('\r', '\n')
+        text = self._extra_blank_lines_re.sub('\n\n', text)
+        text = self._inline_space_re.sub(' ', text)
         
         lines = text.split('\n')
         processed_lines = []
@@ -351,16 +389,16 @@ class CVSectionParserHu:
                 processed_lines.append('')
                 continue
             
-            line = re.sub(r'^[•\-●○▪◦→\*]\s*', '', line)
-            line = re.sub(r'\s+', ' ', line)
+            line = self._bullet_prefix_re.sub('', line)
+            line = self._whitespace_re.sub(' ', line)
             processed_lines.append(line)
         
         return '\n'.join(processed_lines)
 
     def _clean_content(self, content: str) -> str:
         """Clean and normalize content."""
-        content = re.sub(r'\n\s*\n', '\n', content)
-        content = re.sub(r'\s+', ' ', content)
+        content = self._blank_lines_re.sub('\n', content)
+        content = self._whitespace_re.sub(' ', content)
         return content.strip()
 
     def _get_next_content_lines(self, current_line: str, max_lines: int = 3) -> List[str]:
@@ -397,9 +435,9 @@ class CVSectionParserHu:
             processed_text = processed_text.lower()
             processed_text = processed_text.replace(":", " : ")
             processed_text = processed_text.replace("/", " / ")
-            processed_text = re.sub(r'[^a-zA-Z0-9áéíóöőúüűÁÉÍÓÖŐÚÜŰ\s\-]', ' ', processed_text)
-            processed_text = re.sub(r'\s+', ' ', processed_text)
-            processed_text = re.sub(r'(\w)\s*-\s*(\w)', r'\1-\2', processed_text)
+            processed_text = self._model_strip_re.sub(' ', processed_text)
+            processed_text = self._whitespace_re.sub(' ', processed_text)
+            processed_text = self._model_hyphen_re.sub(r'\1-\2', processed_text)
             processed_text = processed_text.strip()
             
             prediction = self.model.predict(processed_text, k=5)
@@ -1,91 +1,139 @@
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
+@lru_cache(maxsize=32)
+def _compile_keywords(keywords: Tuple[str, ...]):
+    """Compile literal keywords into one alternation for substring checks on lowercased lines."""
+    if not keywords:
+        return re.compile(r'(?!)')
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
 class EducationExtractor:
-    def __init__(self, nlp_en):
-        """Initialize EducationExtractor with spaCy model and define constants."""
-        self.nlp = nlp_en
+    # Educational institution types
+    SCHOOLS = [
+        'College', 'University', 'Institute', 'School', 'Academy', 'BASIS', 'Magnet',
+        'Polytechnic', 'Seminary', 'Conservatory', 'Community College', 'Technical College',
+        'Vocational School', 'Graduate School', 'Postgraduate Institute', 'Online University',
+        'Distance Learning Institute', 'Adult Education Center', 'Training Institute',
+        'Career College', 'Specialized School', 'Art School', 'Music School', 'Language School',
+        'Nursing School', 'Business School', 'Law School', 'Medical School', 'Engineering School',
+        'Science Institute', 'Research Institute', 'Fashion School', 'Culinary School',
+        'Design School', 'Film School', 'Theater School', 'Sports Academy', 'Military Academy',
+        'Flight School', 'Beauty School', 'Cosmetology School', 'Massage Therapy School',
+        'Pharmacy School', 'Dental School', 'Optometry School', 'Public Health School',
+        'Environmental School', 'Information Technology School', 'Cybersecurity School',
+        'Data Science Institute', 'Artificial Intelligence Institute', 'Blockchain Academy'
+    ]
+    _schools_lower = tuple(school.lower() for school in SCHOOLS)
+    _school_re = re.compile('|'.join(map(re.escape, _schools_lower)))
 
-        # Educational institution types
-        self.SCHOOLS = [
-            'College', 'University', 'Institute', 'School', 'Academy', 'BASIS', 'Magnet',
-            'Polytechnic', 'Seminary', 'Conservatory', 'Community College', 'Technical College',
-            'Vocational School', 'Graduate School', 'Postgraduate Institute', 'Online University',
-            'Distance Learning Institute', 'Adult Education Center', 'Training Institute',
-            'Career College', 'Specialized School', 'Art School', 'Music School', 'Language School',
-            'Nursing School', 'Business School', 'Law School', 'Medical School', 'Engineering School',
-            'Science Institute', 'Research Institute', 'Fashion School', 'Culinary School',
-            'Design School', 'Film School', 'Theater School', 'Sports Academy', 'Military Academy',
-            'Flight School', 'Beauty School', 'Cosmetology School', 'Massage Therapy School',
-            'Pharmacy School', 'Dental School', 'Optometry School', 'Public Health School',
-            'Environmental School', 'Information Technology School', 'Cybersecurity School',
-            'Data Science Institute', 'Artificial Intelligence Institute', 'Blockchain Academy'
-        ]
-        
-        # Academic degrees and qualifications
-        self.DEGREES = [
-            'Associate', 'Bachelor', 'Master', 'PhD', 'Ph.D', 'BSc', 'BA', 'MS', 'MSc', 'MBA',
-            'Diploma', 'Engineer', 'Technician', 'BEng', 'MEng', 'BBA', 'DBA', 'MD', 'JD',
-            'LLB', 'LLM', 'EdD', 'DPhil', 'MPhil', 'MAcc', 'MFA', 'BFA',
-            'Certificate', 'Advanced Diploma', 'Higher National Diploma', 'Foundation Degree',
-            'Postgraduate Certificate', 'Postgraduate Diploma', 'Doctor of Education', 'Doctor of Philosophy',
-            'Master of Arts', 'Master of Science', 'Master of Business Administration', 'Bachelor of Arts',
-            'Bachelor of Science', 'Bachelor of Engineering', 'Bachelor of Fine Arts', 'Bachelor of Music',
-            'Master of Fine Arts', 'Master of Public Administration', 'Master of Public Health', 'Master of Social Work',
-            'Master of Education', 'Master of Architecture', 'Master of Laws', 'Master of International Business',
-            'Doctor of Medicine', 'Doctor of Jurisprudence', 'Doctor of Nursing Practice', 'Doctor of Pharmacy',
-            'Doctor of Veterinary Medicine', 'Doctor of Optometry', 'Doctor of Dental Surgery', 'Doctor of Physical Therapy'
-        ]
-        
-        # Academic honors and distinctions
-        self.HONORS = [
-            'summa cum laude', 'magna cum laude', 'cum laude', 'with honors', 'with distinction',
-            'first class', 'second class', 'merit', 'distinction', 'dean\'s list', 'highest honors',
-            'high honors', 'honors', 'honors graduate', 'graduated with honors', 'top of the class',
-            'valedictorian', 'president\'s list', 'chancellor\'s list', 'academic excellence',
-            'academic achievement', 'outstanding achievement', 'recognition of excellence',
-            'scholar', 'honor roll', 'exemplary performance', 'distinguished scholar', 
-            'academic distinction', 'summa cum laude graduate', 'magna cum laude graduate',
-            'cum laude graduate', 'with high honors', 'with great distinction', 'with special honors',
-            'with commendation', 'with accolades', 'top honors', 'honorary mention', 'academic merit',
-            'recognized for excellence', 'notable achievement', 'academic honors', 'scholastic honors'
-        ]
-        
-        # Section headers for identifying education sections
-        self.section_headers = {
-            'education': [
-                'education', 'academic background', 'qualifications', 'academic qualifications',
-                'educational background', 'education and training', 'academic history',
-                'education details', 'academic details', 'education & qualifications',
-                'academic profile', 'studies', 'learning', 'training history', 'schooling',
-                'coursework', 'degree information', 'educational qualifications', 'certifications',
-                'academic achievements', 'professional development', 'educational experience'
-            ]
-        }
+    # Academic degrees and qualifications
+    DEGREES = [
+        'Associate', 'Bachelor', 'Master', 'PhD', 'Ph.D', 'BSc', 'BA', 'MS', 'MSc', 'MBA',
+        'Diploma', 'Engineer', 'Technician', 'BEng', 'MEng', 'BBA', 'DBA', 'MD', 'JD',
+        'LLB', 'LLM', 'EdD', 'DPhil', 'MPhil', 'MAcc', 'MFA', 'BFA',
+        'Certificate', 'Advanced Diploma', 'Higher National Diploma', 'Foundation Degree',
+        'Postgraduate Certificate', 'Postgraduate Diploma', 'Doctor of Education', 'Doctor of Philosophy',
+        'Master of Arts', 'Master of Science', 'Master of Business Administration', 'Bachelor of Arts',
+        'Bachelor of Science', 'Bachelor of Engineering', 'Bachelor of Fine Arts', 'Bachelor of Music',
+        'Master of Fine Arts', 'Master of Public Administration', 'Master of Public Health', 'Master of Social Work',
+        'Master of Education', 'Master of Architecture', 'Master of Laws', 'Master of International Business',
+        'Doctor of Medicine', 'Doctor of Jurisprudence', 'Doctor of Nursing Practice', 'Doctor of Pharmacy',
+        'Doctor of Veterinary Medicine', 'Doctor of Optometry', 'Doctor of Dental Surgery', 'Doctor of Physical Therapy'
+    ]
 
-        # Keywords for education-related content
-        self.education_keywords = [
-            'university', 'college', 'institute', 'school', 'academy', 'degree', 'bachelor', 
-            'master', 'phd', 'gpa', 'coursework', 'course', 'program', 'diploma', 
-            'certification', 'training', 'higher education', 'vocational training', 
-            'associate degree', 'graduate degree', 'postgraduate degree', 'online course', 
-            'distance learning', 'certificate program', 'professional development', 
-            'academic program', 'educational institution', 'learning experience', 
-            'curriculum', 'academic achievement', 'scholarship', 'internship', 
-            'apprenticeship', 'continuing education', 'adult education'
-        ]
+    # Academic honors and distinctions
+    HONORS = [
+        'summa cum laude', 'magna cum laude', 'cum laude', 'with honors', 'with distinction',
+        'first class', 'second class', 'merit', 'distinction', 'dean\'s list', 'highest honors',
+        'high honors', 'honors', 'honors graduate', 'graduated with honors', 'top of the class',
+        'valedictorian', 'president\'s list', 'chancellor\'s list', 'academic excellence',
+        'academic achievement', 'outstanding achievement', 'recognition of excellence',
+        'scholar', 'honor roll', 'exemplary performance', 'distinguished scholar', 
+        'academic distinction', 'summa cum laude graduate', 'magna cum laude graduate',
+        'cum laude graduate', 'with high honors', 'with great distinction', 'with special honors',
+        'with commendation', 'with accolades', 'top honors', 'honorary mention', 'academic merit',
+        'recognized for excellence', 'notable achievement', 'academic honors', 'scholastic honors'
+    ]
 
-        # Date extraction patterns
-        self.date_patterns = [
-            r'(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?) \d{4}',
-            r'\d{1,2}/\d{1,2}/\d{2,4}',
-            r'\d{4}',
-            r'\d{2}\.\d{2}\.\d{4}',
-            r'\d{4}/\d{2}/\d{2}',
-            r'\d{2}/\d{2}/\d{4}',
-            r'(Summer|Fall|Winter|Spring) \d{4}',
-            r'\d{1,2} (?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?),? \d{4}'
+    # Section headers for identifying education sections
+    section_headers = {
+        'education': [
+            'education', 'academic background', 'qualifications', 'academic qualifications',
+            'educational background', 'education and training', 'academic history',
+            'education details', 'academic details', 'education & qualifications',
+            'academic profile', 'studies', 'learning', 'training history', 'schooling',
+            'coursework', 'degree information', 'educational qualifications', 'certifications',
+            'academic achievements', 'professional development', 'educational experience'
         ]
+    }
+
+    # Keywords for education-related content
+    education_keywords = [
+        'university', 'college', 'institute', 'school', 'academy', 'degree', 'bachelor', 
+        'master', 'phd', 'gpa', 'coursework', 'course', 'program', 'diploma', 
+        'certification', 'training', 'higher education', 'vocational training', 
+        'associate degree', 'graduate degree', 'postgraduate degree', 'online course', 
+        'distance learning', 'certificate program', 'professional development', 
+        'academic program', 'educational institution', 'learning experience', 
+        'curriculum', 'academic achievement', 'scholarship', 'internship', 
+        'apprenticeship', 'continuing education', 'adult education'
+    ]
+
+    # Date extraction patterns
+    date_patterns = [
+        r'(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?) \d{4}',
+        r'\d{1,2}/\d{1,2}/\d{2,4}',
+        r'\d{4}',
+        r'\d{2}\.\d{2}\.\d{4}',
+        r'\d{4}/\d{2}/\d{2}',
+        r'\d{2}/\d{2}/\d{4}',
+        r'(Summer|Fall|Winter|Spring) \d{4}',
+        r'\d{1,2} (?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?),? \d{4}'
+    ]
+
+    # Mapping of letter and text grades to GPA values
+    grade_map = {
+        'A+': '4.0', 'A': '4.0', 'A-': '3.7',
+        'B+': '3.3', 'B': '3.0', 'B-': '2.7',
+        'C+': '2.3', 'C': '2.0', 'C-': '1.7',
+        'D+': '1.3', 'D': '1.0', 'F': '0.0',
+        'excellent': '5.0', 'very good': '4.0',
+        'good': '3.0', 'satisfactory': '2.0',
+        'pass': '1.0'
+    }
+
+    # Precompiled line classifiers used by the education line loop
+    _education_header_re = re.compile('|'.join(section_headers['education']), re.IGNORECASE)
+    _tech_re = re.compile(r'\b(?:HTML5?|CSS|JavaScript|Node\.js|SQL|SAP|Windows|Linux|Mac|Office)\b', re.IGNORECASE)
+    _education_line_re = re.compile(
+        r'\b(?:University|College|Institute|School|Academy)\b'
+        r'|\b(?:Bachelor|Master|PhD|BSc|MSc|BA|MA|MBA|BBA)\b'
+        r'|\b(?:Degree|Diploma|Certificate)\b'
+        r'|\b(?:Major|Minor|Specialization)\b',
+        re.IGNORECASE
+    )
+    _education_content_re = re.compile(
+        _education_line_re.pattern +
+        r'|\b(?:Education|Study|Studies)\b'
+        r'|(?:Computer Science|Engineering|Informatics)\b',
+        re.IGNORECASE
+    )
+    _degree_re = re.compile(
+        r'\b(?:Bachelor|Master|PhD|Ph\.D|BSc|BA|MS|MSc|MBA|Associate|Diploma)\b'
+        r'|\b(?:B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|Ph\.?D\.?)\b'
+        r'|\b(?:Engineer|Engineering|Technician)\b'
+        r'|\b(?:Computer Science|Information Technology|IT|CS)\b',
+        re.IGNORECASE
+    )
+
+    # Headers that end an extracted section
+    _next_section_re = _compile_keywords(('experience', 'skills', 'projects', 'languages'))
+
+    def __init__(self, nlp_en):
+        """Initialize EducationExtractor with spaCy model."""
+        self.nlp = nlp_en
 
     # MAIN EXTRACTION METHODS
     def extract_education(self, text: str, parsed_sections: Dict[str, List[str]] = None) -> List[Dict]:
@@ -95,17 +143,22 @@ class EducationExtractor:
         
         education_lines = []
         used_fallback = False
+        text_lines = None
         
         if parsed_sections and 'education' in parsed_sections:
-            section_lines = [line.strip() for line in parsed_sections['education'] if line.strip()]
-            section_lines = [
-                line for line in section_lines 
-                if not any(keyword in line.lower() for keyword in [
-                    'experience:', 'skills:', 'languages:', 'projects:', 
-                    'certifications:', 'awards:', 'publications:', 'interests:',
-                    'references:', 'profile:', 'summary:'
-                ])
-            ]
+            stop_keywords = (
+                'experience:', 'skills:', 'languages:', 'projects:', 
+                'certifications:', 'awards:', 'publications:', 'interests:',
+                'references:', 'profile:', 'summary:'
+            )
+            section_lines = []
+            for line in parsed_sections['education']:
+                line = line.strip()
+                if not line:
+                    continue
+                line_lower = line.lower()
+                if not any(keyword in line_lower for keyword in stop_keywords):
+                    section_lines.append(line)
             if self._validate_section_data(section_lines):
                 education_lines = section_lines
             else:
@@ -119,34 +172,30 @@ class EducationExtractor:
                 r'EDUCATIONAL\s+(?:HISTORY|BACKGROUND)',
             ]
             
+            text_lines = [line.strip() for line in text.split('\n')]
             for pattern in education_patterns:
-                section_text = self.extract_section(text, [pattern])
+                section_text = self.extract_section(text, [pattern], text_lines)
                 if section_text:
                     education_lines.extend([line.strip() for line in section_text if line.strip()])
 
         if not education_lines and not parsed_sections:
-            text_lines = text.split('\n')
+            if text_lines is None:
+                text_lines = [line.strip() for line in text.split('\n')]
             for line in text_lines:
-                if any(keyword in line.lower() for keyword in ['university', 'college', 'bachelor', 'master', 'phd', 'degree', 'diploma']):
-                    if not any(keyword in line.lower() for keyword in ['experience', 'skill', 'project']):
-                        education_lines.append(line.strip())
+                line_lower = line.lower()
+                if any(keyword in line_lower for keyword in ('university', 'college', 'bachelor', 'master', 'phd', 'degree', 'diploma')):
+                    if not any(keyword in line_lower for keyword in ('experience', 'skill', 'project')):
+                        education_lines.append(line)
 
         if education_lines:
             for line in education_lines:
-                if not line or any(re.search(pattern, line, re.IGNORECASE) for pattern in self.section_headers['education']):
+                if not line or self._education_header_re.search(line):
                     continue
                 
-                if re.search(r'\b(?:HTML5?|CSS|JavaScript|Node\.js|SQL|SAP|Windows|Linux|Mac|Office)\b', line, re.IGNORECASE):
+                if self._tech_re.search(line):
                     continue
                 
-                education_indicators = [
-                    r'\b(?:University|College|Institute|School|Academy)\b',
-                    r'\b(?:Bachelor|Master|PhD|BSc|MSc|BA|MA|MBA|BBA)\b',
-                    r'\b(?:Degree|Diploma|Certificate)\b',
-                    r'\b(?:Major|Minor|Specialization)\b'
-                ]
-                
-                is_education_line = any(re.search(pattern, line, re.IGNORECASE) for pattern in education_indicators)
+                is_education_line = bool(self._education_line_re.search(line))
                 
                 if is_education_line:
                     if current_entry and (current_entry['school'] or current_entry['degree']):
@@ -202,69 +251,34 @@ class EducationExtractor:
         
         cleaned_data = []
         for entry in education_data:
-            if entry.get('school') and any(keyword in entry['school'].lower() for keyword in ['html', 'css', 'javascript', 'sql', 'windows', 'linux', 'http']):
-                continue
-            
             if not entry.get('school') and not entry.get('degree'):
                 continue
             
-            if not entry.get('school') and not entry.get('degree') and entry.get('descriptions'):
-                for desc in entry['descriptions']:
-                    if any(keyword in desc.lower() for keyword in ['university', 'college', 'institute', 'school']):
-                        parts = desc.split(',', 1)
-                        entry['school'] = parts[0].strip()
-                        if len(parts) > 1:
-                            entry['degree'] = parts[1].strip()
-                        break
+            if entry.get('school') and any(keyword in entry['school'].lower() for keyword in ('html', 'css', 'javascript', 'sql', 'windows', 'linux', 'http')):
+                continue
             
-            if entry.get('school') or entry.get('degree'):
-                cleaned_data.append(entry)
+            cleaned_data.append(entry)
         
-        return cleaned_data if cleaned_data else []
-
-    def extract_education_descriptions(self, text: str) -> List[str]:
-        """Extract detailed education descriptions using NLP and dependency parsing."""
-        doc = self.nlp(text)
-        descriptions = []
-
-        action_verbs = {'study', 'graduate', 'complete', 'attend', 'enroll', 'achieve', 'earn', 'obtain'}
+        return cleaned_data
 
-        for sent in doc.sents:
-            for token in sent:
-                if token.dep_ in {'ROOT', 'advcl', 'xcomp'} and token.lemma_ in action_verbs:
-                    descriptions.append(sent.text.strip())
-                    break
-
-            if any(ent.label_ in {'ORG', 'DATE', 'PERSON'} for ent in sent.ents):
-                descriptions.append(sent.text.strip())
-
-            if re.match(r'^[•*-]\s*', sent.text) or re.match(r'^\d+\.', sent.text):
-                clean_description = sent.text.strip().lstrip('-•* ')
-                if clean_description:
-                    descriptions.append(clean_description)
-
-        return descriptions
-
-    def extract_section(self, text: str, section_keywords: List[str]) -> List[str]:
-        """Extract a section from text based on keywords."""
-        lines = text.split('\n')
+    def extract_section(self, text: str, section_keywords: List[str], lines: Optional[List[str]] = None) -> List[str]:
+        """Extract a section from text based on keywords, optionally reusing already stripped lines."""
+        if lines is None:
+            lines = [line.strip() for line in text.split('\n')]
+        lines_lower = [line.lower() for line in lines]
         section_lines = []
         in_section = False
+        header_re = _compile_keywords(tuple(section_keywords))
         
         for i, line in enumerate(lines):
-            line = line.strip()
             if not line:
                 continue
             
-            is_section_header = any(keyword in line.lower() for keyword in section_keywords)
+            is_section_header = bool(header_re.search(lines_lower[i]))
             is_next_different_section = False
             
             if i < len(lines) - 1:
-                next_line = lines[i + 1].strip()
-                is_next_different_section = any(
-                    keyword in next_line.lower() 
-                    for keyword in ['experience', 'skills', 'projects', 'languages']
-                )
+                is_next_different_section = bool(self._next_section_re.search(lines_lower[i + 1]))
             
             if is_section_header:
                 in_section = True
@@ -324,17 +338,7 @@ class EducationExtractor:
             if match:
                 grade = match.group(1)
                 grade = grade.replace(',', '.')
-                
-                grade_map = {
-                    'A+': '4.0', 'A': '4.0', 'A-': '3.7',
-                    'B+': '3.3', 'B': '3.0', 'B-': '2.7',
-                    'C+': '2.3', 'C': '2.0', 'C-': '1.7',
-                    'D+': '1.3', 'D': '1.0', 'F': '0.0',
-                    'excellent': '5.0', 'very good': '4.0',
-                    'good': '3.0', 'satisfactory': '2.0',
-                    'pass': '1.0'
-                }
-                return grade_map.get(grade.lower(), grade)
+                return self.grade_map.get(grade.lower(), grade)
         
         return None
     
@@ -397,64 +401,34 @@ class EducationExtractor:
         return None
 
     # VALIDATION AND CLEANING METHODS
-    def has_school(self, text: str) -> bool:
+    def has_school(self, text: str, text_lower: Optional[str] = None) -> bool:
         """Check if text contains a school name."""
-        if re.search(r'\b(?:HTML5?|CSS|JavaScript|Node\.js|SQL|SAP|Windows|Linux|Mac|Office)\b', text, re.IGNORECASE):
+        if self._tech_re.search(text):
             return False
             
         if text.strip().startswith(('•', '-', '*')):
             return False
             
-        doc = self.nlp(text)
-        for ent in doc.ents:
-            if ent.label_ in {'ORG', 'FAC'} and any(school.lower() in ent.text.lower() for school in self.SCHOOLS):
-                return True
-        
-        text_lower = text.lower()
-        return any(school.lower() in text_lower for school in self.SCHOOLS)
+        if text_lower is None:
+            text_lower = text.lower()
+        return bool(self._school_re.search(text_lower))
 
     def has_degree(self, text: str) -> bool:
         """Check if text contains a degree."""
-        if re.search(r'\b(?:HTML5?|CSS|JavaScript|Node\.js|SQL|SAP|Windows|Linux|Mac|Office)\b', text, re.IGNORECASE):
+        if self._tech_re.search(text):
             return False
             
         if text.strip().startswith(('•', '-', '*')):
             return False
             
-        degree_patterns = [
-            r'\b(?:Bachelor|Master|PhD|Ph\.D|BSc|BA|MS|MSc|MBA|Associate|Diploma)\b',
-            r'\b(?:B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|Ph\.?D\.?)\b',
-            r'\b(?:Engineer|Engineering|Technician)\b',
-            r'\b(?:Computer Science|Information Technology|IT|CS)\b'
-        ]
-        
-        for pattern in degree_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-                
-        return False
+        return bool(self._degree_re.search(text))
 
     def _validate_section_data(self, section_lines: List[str]) -> bool:
         """Validate if the section data is meaningful and contains education information."""
         if not section_lines:
             return False
         
-        education_indicators = [
-            r'\b(?:University|College|Institute|School|Academy)\b',
-            r'\b(?:Bachelor|Master|PhD|BSc|MSc|BA|MA|MBA|BBA)\b',
-            r'\b(?:Degree|Diploma|Certificate)\b',
-            r'\b(?:Major|Minor|Specialization)\b',
-            r'\b(?:Education|Study|Studies)\b',
-            r'(?:Computer Science|Engineering|Informatics)\b'
-        ]
-        
-        has_education_content = False
-        for line in section_lines:
-            if any(re.search(pattern, line, re.IGNORECASE) for pattern in education_indicators):
-                has_education_content = True
-                break
-                
-        return has_education_content
+        return any(self._education_content_re.search(line) for line in section_lines)
 
     def _clean_school_name(self, text: str) -> Tuple[str, str, str]:
         """Clean and separate school name from degree and GPA information."""
@@ -531,6 +505,7 @@ class EducationExtractor:
     def _clean_descriptions(self, descriptions: List[str]) -> List[str]:
         """Clean and filter education descriptions."""
         cleaned = []
+        seen = set()
         for desc in descriptions:
             desc = re.sub(r'^[-•*]\s*', '', desc.strip())
             
@@ -540,9 +515,10 @@ class EducationExtractor:
             if re.match(r'^[A-Za-z\s,]+$', desc) and len(desc.split()) <= 3:
                 continue
                 
-            if any(d.strip() == desc.strip() for d in cleaned):
+            if desc in seen:
                 continue
                 
+            seen.add(desc)
             cleaned.append(desc)
         
         return cleaned
\ No newline at end of file
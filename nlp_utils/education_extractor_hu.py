@@ -2,75 +2,98 @@ import re
 from typing import Optional, List, Dict, Tuple
 
 class EducationExtractorHu:
+    # Educational institution types
+    SCHOOLS = [
+        'Egyetem', 'Főiskola', 'Iskola', 'Gimnázium', 'Szakközépiskola', 'Technikum'
+    ]
+
+    # Academic degrees and qualifications
+    DEGREES = [
+        'Mérnök', 'Diploma', 'Technikus', 'Érettségi', 'Szakképzés', 
+        'BSc', 'MSc', 'PhD', 'BA', 'MA', 'Dr.', 'Doktor',
+        'Szakmérnök', 'Üzemmérnök', 'Okleveles', 'Felsőfokú', 'Középfokú',
+        'Bizonyítvány', 'Tanúsítvány', 'Képesítés'
+    ]
+
+    # Fields of study
+    DEGREE_FIELDS = [
+        'Informatika', 'Programtervező', 'Gazdasági', 'Műszaki', 'Gépész', 'Villamos',
+        'Közgazdász', 'Matematika', 'Fizika', 'Kémia', 'Biológia', 'Környezetvédelem',
+        'Kommunikáció', 'Marketing', 'Menedzsment', 'Logisztika', 'Turizmus',
+        'Jog', 'Jogász', 'Mérnök informatikus', 'Programozó', 'Rendszergazda',
+        'Szoftverfejlesztő', 'Frontend fejlesztő', 'Backend fejlesztő', 'Full stack'
+    ]
+
+    # Pre-lowercased keyword tuples for case-insensitive substring checks
+    _schools_lower = tuple(school.lower() for school in SCHOOLS)
+    _degrees_lower = tuple(degree.lower() for degree in DEGREES)
+    _degree_fields_lower = tuple(field.lower() for field in DEGREE_FIELDS)
+    _entry_school_keywords = _schools_lower + ('egyetem', 'főiskola', 'iskola', 'intézet')
+    _entry_degree_keywords = _degrees_lower + _degree_fields_lower
+    _school_re = re.compile('|'.join(map(re.escape, _schools_lower)))
+    _degree_re = re.compile('|'.join(map(re.escape, _degrees_lower)))
+    _degree_field_re = re.compile('|'.join(map(re.escape, _degree_fields_lower)))
+
+    # Non-education related keywords
+    NON_EDUCATION_KEYWORDS = [
+        'windows', 'ms office', 'sap', 'nyelv', 'német', 'angol', 'francia', 'orosz',
+        'fejlesztő', 'programozó', 'tapasztalat', 'év'
+    ]
+
+    # Section headers for identifying education sections
+    section_headers = {
+        'education': ['tanulmányok', 'képzettség', 'iskolai végzettség', 'végzettség', 'végzettségem']
+    }
+
+    # Keywords related to education
+    education_keywords = [
+        'egyetem', 'főiskola', 'iskola', 'intézet', 'akadémia', 'diploma', 'képzés',
+        'tanfolyam', 'program', 'bizonyítvány', 'szakképzés', 'továbbképzés', 'vizsga'
+    ]
+
+    # Date patterns for extracting education dates
+    date_patterns = [
+        r'(\d{4})\s*[-–]\s*(\d{4})',
+        r'(\d{4})\s*[-–]\s*(?:jelen|folyamatban)',
+        r'(\d{4})\.',
+        r'(\d{4})'
+    ]
+
+    # GPA patterns for extracting grades
+    gpa_patterns = [
+        r'([1-5][.,]\d{1,2})',
+        r'(jeles|kitűnő|kiváló|jó|közepes|elégséges)',
+        r'summa cum laude|cum laude'
+    ]
+
+    # Mapping of text-based grades to numeric values
+    gpa_mapping = {
+        'jeles': '5.0',
+        'kitűnő': '5.0',
+        'kiváló': '5.0',
+        'jó': '4.0',
+        'közepes': '3.0',
+        'elégséges': '2.0',
+        'summa cum laude': '5.0',
+        'cum laude': '4.5'
+    }
+
+    # Education block boundaries for the fallback extraction
+    _edu_header_re = re.compile(
+        r'(?:TANULMÁNYOK|VÉGZETTSÉG|KÉPZETTSÉG|ISKOLAI\s*VÉGZETTSÉG|KÉPESÍTÉS|OKTATÁS|TANULMÁNYI\s*ADATOK|ISKOLÁK)[\s:]*',
+        re.IGNORECASE
+    )
+    _edu_end_re = re.compile(
+        r'\n\s*(?:MUNKATAPASZTALAT|SZAKMAI\s*TAPASZTALAT|TAPASZTALAT|KÉSZSÉGEK|NYELVTUDÁS|EGYÉB|MUNKAHELYEK|$)',
+        re.IGNORECASE
+    )
+    _edu_block_re = re.compile(_edu_header_re.pattern + r'.*?(?=' + _edu_end_re.pattern + r')', re.DOTALL | re.IGNORECASE)
+
+    _non_education_re = re.compile('|'.join(map(re.escape, NON_EDUCATION_KEYWORDS)))
+
     def __init__(self, nlp_hu):
-        """Initialize EducationExtractorHu with spaCy model and define constants."""
+        """Initialize EducationExtractorHu with spaCy model."""
         self.nlp_hu = nlp_hu
-        
-        # Educational institution types
-        self.SCHOOLS = [
-            'Egyetem', 'Főiskola', 'Iskola', 'Gimnázium', 'Szakközépiskola', 'Technikum'
-        ]
-        
-        # Academic degrees and qualifications
-        self.DEGREES = [
-            'Mérnök', 'Diploma', 'Technikus', 'Érettségi', 'Szakképzés', 
-            'BSc', 'MSc', 'PhD', 'BA', 'MA', 'Dr.', 'Doktor',
-            'Szakmérnök', 'Üzemmérnök', 'Okleveles', 'Felsőfokú', 'Középfokú',
-            'Bizonyítvány', 'Tanúsítvány', 'Képesítés'
-        ]
-
-        # Fields of study
-        self.DEGREE_FIELDS = [
-            'Informatika', 'Programtervező', 'Gazdasági', 'Műszaki', 'Gépész', 'Villamos',
-            'Közgazdász', 'Matematika', 'Fizika', 'Kémia', 'Biológia', 'Környezetvédelem',
-            'Kommunikáció', 'Marketing', 'Menedzsment', 'Logisztika', 'Turizmus',
-            'Jog', 'Jogász', 'Mérnök informatikus', 'Programozó', 'Rendszergazda',
-            'Szoftverfejlesztő', 'Frontend fejlesztő', 'Backend fejlesztő', 'Full stack'
-        ]
-
-        # Non-education related keywords
-        self.NON_EDUCATION_KEYWORDS = [
-            'windows', 'ms office', 'sap', 'nyelv', 'német', 'angol', 'francia', 'orosz',
-            'fejlesztő', 'programozó', 'tapasztalat', 'év'
-        ]
-
-        # Section headers for identifying education sections
-        self.section_headers = {
-            'education': ['tanulmányok', 'képzettség', 'iskolai végzettség', 'végzettség', 'végzettségem']
-        }
-
-        # Keywords related to education
-        self.education_keywords = [
-            'egyetem', 'főiskola', 'iskola', 'intézet', 'akadémia', 'diploma', 'képzés',
-            'tanfolyam', 'program', 'bizonyítvány', 'szakképzés', 'továbbképzés', 'vizsga'
-        ]
-
-        # Date patterns for extracting education dates
-        self.date_patterns = [
-            r'(\d{4})\s*[-–]\s*(\d{4})',
-            r'(\d{4})\s*[-–]\s*(?:jelen|folyamatban)',
-            r'(\d{4})\.',
-            r'(\d{4})'
-        ]
-
-        # GPA patterns for extracting grades
-        self.gpa_patterns = [
-            r'([1-5][.,]\d{1,2})',
-            r'(jeles|kitűnő|kiváló|jó|közepes|elégséges)',
-            r'summa cum laude|cum laude'
-        ]
-
-        # Mapping of text-based grades to numeric values
-        self.gpa_mapping = {
-            'jeles': '5.0',
-            'kitűnő': '5.0',
-            'kiváló': '5.0',
-            'jó': '4.0',
-            'közepes': '3.0',
-            'elégséges': '2.0',
-            'summa cum laude': '5.0',
-            'cum laude': '4.5'
-        }
 
     # Main extraction methods
     def extract_education(self, text: str, parsed_sections: Optional[Dict] = None) -> List[Dict]:
@@ -116,25 +139,31 @@ class EducationExtractorHu:
         education_data = []
         
         try:
-            edu_pattern = r'(?:TANULMÁNYOK|VÉGZETTSÉG|KÉPZETTSÉG|ISKOLAI\s*VÉGZETTSÉG|KÉPESÍTÉS|OKTATÁS|TANULMÁNYI\s*ADATOK|ISKOLÁK)[\s:]*.*?(?=\n\s*(?:MUNKATAPASZTALAT|SZAKMAI\s*TAPASZTALAT|TAPASZTALAT|KÉSZSÉGEK|NYELVTUDÁS|EGYÉB|MUNKAHELYEK|$))'
-            edu_match = re.search(edu_pattern, text, re.DOTALL | re.IGNORECASE)
-            
-            text_to_process = edu_match.group(0) if edu_match else text
+            text_to_process = text
+            header_match = self._edu_header_re.search(text)
+            if header_match:
+                end_match = self._edu_end_re.search(text, header_match.end())
+                if end_match:
+                    text_to_process = text[header_match.start():end_match.start()]
+                else:
+                    edu_match = self._edu_block_re.search(text)
+                    text_to_process = edu_match.group(0) if edu_match else text
 
             lines = [self.clean_text(line) for line in text_to_process.split('\n') if line.strip()]
             education_entries = []
             current_entry = []
 
             for line in lines:
-                if self.is_non_education(line) or len(line.split()) < 2:
+                line_lower = line.lower()
+                if self.is_non_education(line, line_lower) or len(line.split()) < 2:
                     continue
 
                 doc = self.nlp_hu(line)
                 
                 is_new_entry = (
-                    self.has_school(line) or
-                    self.has_degree(line) or
-                    self.has_degree_field(line) or
+                    self.has_school(line, line_lower) or
+                    self.has_degree(line, line_lower) or
+                    self.has_degree_field(line, line_lower) or
                     bool(re.search(r'\b(?:19|20)\d{2}\b', line)) or
                     any(ent.label_ == 'ORG' for ent in doc.ents)
                 )
@@ -182,25 +211,32 @@ class EducationExtractorHu:
         return education_data
 
     # Entity detection methods
-    def has_school(self, text: str) -> bool:
+    def has_school(self, text: str, text_lower: Optional[str] = None) -> bool:
         """Check if text contains a school or educational institution."""
+        if text_lower is None:
+            text_lower = text.lower()
+        if self._school_re.search(text_lower):
+            return True
         doc = self.nlp_hu(text)
-        for ent in doc.ents:
-            if ent.label_ in {'ORG', 'FAC', 'GPE', 'LOC'}:
-                return True
-        return any(school.lower() in text.lower() for school in self.SCHOOLS)
+        return any(ent.label_ in {'ORG', 'FAC', 'GPE', 'LOC'} for ent in doc.ents)
     
-    def has_degree(self, text: str) -> bool:
+    def has_degree(self, text: str, text_lower: Optional[str] = None) -> bool:
         """Check if text contains a degree."""
-        return any(degree.lower() in text.lower() for degree in self.DEGREES)
+        if text_lower is None:
+            text_lower = text.lower()
+        return bool(self._degree_re.search(text_lower))
 
-    def has_degree_field(self, text: str) -> bool:
+    def has_degree_field(self, text: str, text_lower: Optional[str] = None) -> bool:
         """Check if text contains a field of study."""
-        return any(field.lower() in text.lower() for field in self.DEGREE_FIELDS)
+        if text_lower is None:
+            text_lower = text.lower()
+        return bool(self._degree_field_re.search(text_lower))
 
-    def is_non_education(self, text: str) -> bool:
+    def is_non_education(self, text: str, text_lower: Optional[str] = None) -> bool:
         """Check if text contains non-education related keywords."""
-        return any(keyword in text.lower() for keyword in self.NON_EDUCATION_KEYWORDS)
+        if text_lower is None:
+            text_lower = text.lower()
+        return bool(self._non_education_re.search(text_lower))
 
     # Text processing methods
     def clean_text(self, text: str) -> str:
@@ -234,12 +270,11 @@ class EducationExtractorHu:
             if potential_entries:
                 for entry in potential_entries:
                     doc = self.nlp_hu(entry)
+                    entry_lower = entry.lower()
                     
-                    has_school = any(keyword.lower() in entry.lower() 
-                                   for keyword in self.SCHOOLS + ['egyetem', 'főiskola', 'iskola', 'intézet'])
+                    has_school = any(keyword in entry_lower for keyword in self._entry_school_keywords)
                     has_org = any(ent.label_ == 'ORG' for ent in doc.ents)
-                    has_degree = any(keyword.lower() in entry.lower() 
-                                   for keyword in self.DEGREES + self.DEGREE_FIELDS)
+                    has_degree = any(keyword in entry_lower for keyword in self._entry_degree_keywords)
                     has_date = bool(re.search(r'\b(?:19|20)\d{2}\b', entry))
                     
                     if (has_school or has_org) or (has_degree and has_date):
@@ -272,8 +307,8 @@ class EducationExtractorHu:
             remaining_doc = self.nlp_hu(remaining_text)
             
             for token in remaining_doc:
-                if token.pos_ == 'NOUN' and any(keyword.lower() in token.text.lower() 
-                    for keyword in self.DEGREES + self.DEGREE_FIELDS):
+                if token.pos_ == 'NOUN' and any(keyword in token.lower_ 
+                    for keyword in self._entry_degree_keywords):
                     phrase = []
                     for t in token.subtree:
                         if t.pos_ in ['NOUN', 'ADJ', 'PROPN']:
@@ -293,8 +328,7 @@ class EducationExtractorHu:
                 if (sent_text and 
                     sent_text not in [school, degree] and
                     len(sent_text.split()) > 2 and
-                    not any(keyword.lower() in sent_text.lower() 
-                           for keyword in self.NON_EDUCATION_KEYWORDS)):
+                    not self.is_non_education(sent_text)):
                     descriptions.append(sent_text)
 
         except Exception as e:
@@ -50,15 +50,16 @@ class LanguageExtractor:
         ]
 
     # MAIN EXTRACTION METHODS
-    def extract_languages(self, text: str, parsed_sections: Optional[Dict] = None) -> List[Dict[str, str]]:
-        """Extract languages and their proficiency levels using parsed sections and NER."""
+    def extract_languages(self, text: str, parsed_sections: Optional[Dict] = None, doc=None) -> List[Dict[str, str]]:
+        """Extract languages and their proficiency levels using parsed sections and NER, reusing a parsed Doc if given."""
         languages = []
         found_languages = set()
         
         try:
             # First try using spaCy's NER for languages
-            nlp = self.get_nlp_model_for_text(text)
-            doc = nlp(text)
+            if doc is None:
+                nlp = self.get_nlp_model_for_text(text)
+                doc = nlp(text)
             
             # Extract languages from NER
             for ent in doc.ents:
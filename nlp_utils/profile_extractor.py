@@ -1,22 +1,12 @@
 import re
 from typing import Dict, Optional, List
 from langdetect import detect, LangDetectException
-from spacy.matcher import Matcher
 
 class ProfileExtractor:
     def __init__(self, nlp_en, nlp_hu):
-        """Initialize ProfileExtractor with spaCy models and matchers."""
+        """Initialize ProfileExtractor with spaCy models."""
         self.nlp_en = nlp_en
         self.nlp_hu = nlp_hu
-        self.matcher_en = Matcher(nlp_en.vocab)
-        self.matcher_hu = Matcher(nlp_hu.vocab)
-        self.add_email_patterns()
-
-    def add_email_patterns(self):
-        """Add patterns to matcher for emails."""
-        email_pattern = [{"LIKE_EMAIL": True}]
-        self.matcher_en.add("EMAIL", [email_pattern])
-        self.matcher_hu.add("EMAIL", [email_pattern])
 
     def get_nlp_model_for_text(self, text: str):
         """Determine the language of the text and return the appropriate spaCy NLP model."""
@@ -27,8 +17,8 @@ class ProfileExtractor:
             return self.nlp_en
 
     # MAIN EXTRACTION METHOD
-    def extract_profile(self, text: str, parsed_sections: Optional[Dict] = None) -> Dict[str, str]:
-        """Extract profile information using pattern matching and NLP."""
+    def extract_profile(self, text: str, parsed_sections: Optional[Dict] = None, doc=None) -> Dict[str, str]:
+        """Extract profile information using pattern matching and NLP, reusing a parsed Doc if given."""
         profile_data = {
             'name': "",
             'email': "",
@@ -39,11 +29,12 @@ class ProfileExtractor:
         }
 
         try:
-            nlp = self.get_nlp_model_for_text(text)
-            doc = nlp(text)
+            if doc is None:
+                nlp = self.get_nlp_model_for_text(text)
+                doc = nlp(text)
 
-            profile_data['name'] = self.extract_name(text)
-            profile_data['location'] = self.extract_location(text)
+            profile_data['name'] = self.extract_name(text, doc)
+            profile_data['location'] = self.extract_location(text, doc)
             profile_data['email'] = self.extract_email(doc)
             profile_data['phone'] = self.extract_phone(text)
             profile_data['url'] = self.extract_url(text)
@@ -55,11 +46,12 @@ class ProfileExtractor:
         return profile_data
 
     # ENTITY EXTRACTION METHODS
-    def extract_name(self, text: str) -> str:
+    def extract_name(self, text: str, doc=None) -> str:
         """Extract name using NER and additional validation."""
         try:
-            nlp = self.get_nlp_model_for_text(text)
-            doc = nlp(text)
+            if doc is None:
+                nlp = self.get_nlp_model_for_text(text)
+                doc = nlp(text)
             
             for ent in doc.ents:
                 if ent.label_ == 'PER':
@@ -81,11 +73,12 @@ class ProfileExtractor:
             print(f"Warning: Error extracting name: {str(e)}")
             return ""
 
-    def extract_location(self, text: str) -> str:
+    def extract_location(self, text: str, doc=None) -> str:
         """Extract location using NER."""
         try:
-            nlp = self.get_nlp_model_for_text(text)
-            doc = nlp(text)
+            if doc is None:
+                nlp = self.get_nlp_model_for_text(text)
+                doc = nlp(text)
             
             for ent in doc.ents:
                 if ent.label_ in {'LOC', 'GPE', 'FAC'}:
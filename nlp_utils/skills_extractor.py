@@ -51,6 +51,24 @@ class SkillsExtractor:
             'hungarian', 'angol', 'német', 'francia', 'spanyol', 'olasz', 'portugál', 'orosz'
         ]
 
+        # Precompiled skill matchers: one alternation of all spelling variations per skill,
+        # plus a plain whole-word matcher used by the fallback paths
+        self._skill_res = [(skill, self._compile_skill_variations(skill)) for skill in self.skills]
+        self._skill_word_res = [
+            (skill, re.compile(r'\b' + re.escape(skill) + r'\b', re.IGNORECASE)) for skill in self.skills
+        ]
+
+        # Headers that open a skills block in the fallback line scan
+        self._skill_indicator_re = re.compile(
+            r'^(?:szakmai\s+ismeretek|technikai\s+ismeretek'
+            r'|programozási\s+nyelvek|fejlesztői\s+eszközök'
+            r'|informatikai\s+ismeretek|számítógépes\s+ismeretek'
+            r'|egyéb\s+ismeretek|speciális\s+ismeretek'
+            r'|használt\s+technológiák|ismert\s+technológiák)',
+            re.IGNORECASE
+        )
+        self._subsection_header_re = re.compile(r'^[A-ZÁÉÍÓÖŐÚÜŰ].*:')
+
     # MAIN EXTRACTION METHODS
     def extract_skills(self, text: str, parsed_sections: Optional[Dict] = None) -> List[str]:
         """Extract skills from text using both predefined lists and NLP analysis."""
@@ -62,22 +80,10 @@ class SkillsExtractor:
                     if not skills_text.strip():
                         continue
                         
-                    for skill in self.skills:
-                        skill_variations = [
-                            skill,
-                            skill + 'js',
-                            skill + '.js',
-                            skill.replace('javascript', 'js'),
-                            skill.replace('typescript', 'ts'),
-                            skill.capitalize(),
-                            skill.upper(),
-                        ]
-                        
-                        for variation in skill_variations:
-                            if re.search(r'\b' + re.escape(variation) + r'\b', skills_text, re.IGNORECASE):
-                                normalized_skill = self.normalize_skill(skill)
-                                skills.add(normalized_skill)
-                                break
+                    for skill, skill_re in self._skill_res:
+                        if skill_re.search(skills_text):
+                            normalized_skill = self.normalize_skill(skill)
+                            skills.add(normalized_skill)
                     
                     nlp = self.get_nlp_model_for_text(skills_text)
                     doc = nlp(skills_text)
@@ -113,8 +119,8 @@ class SkillsExtractor:
             print(f"Error extracting skills: {str(e)}")
             if parsed_sections and 'skills' in parsed_sections:
                 for skills_text in parsed_sections['skills']:
-                    for skill in self.skills:
-                        if re.search(r'\b' + re.escape(skill) + r'\b', skills_text, re.IGNORECASE):
+                    for skill, skill_re in self._skill_word_res:
+                        if skill_re.search(skills_text):
                             normalized_skill = self.normalize_skill(skill)
                             skills.add(normalized_skill)
         
@@ -123,24 +129,16 @@ class SkillsExtractor:
             in_skills_section = False
             skills_text = []
             
-            skill_indicators = [
-                r'(?i)^(szakmai\s+ismeretek|technikai\s+ismeretek)',
-                r'(?i)^(programozási\s+nyelvek|fejlesztői\s+eszközök)',
-                r'(?i)^(informatikai\s+ismeretek|számítógépes\s+ismeretek)',
-                r'(?i)^(egyéb\s+ismeretek|speciális\s+ismeretek)',
-                r'(?i)^(használt\s+technológiák|ismert\s+technológiák)'
-            ]
-            
             for line in lines:
                 line = line.strip()
                 
-                if any(re.match(pattern, line) for pattern in skill_indicators):
+                if self._skill_indicator_re.match(line):
                     in_skills_section = True
                     continue
                 
                 if in_skills_section and (
                     any(header in line.lower() for header in ['tapasztalat', 'tanulmányok', 'nyelvtudás', 'referenciák']) or
-                    re.match(r'^[A-ZÁÉÍÓÖŐÚÜŰ].*:', line)
+                    self._subsection_header_re.match(line)
                 ):
                     in_skills_section = False
                 
@@ -152,8 +150,8 @@ class SkillsExtractor:
                 nlp = self.get_nlp_model_for_text(skills_content)
                 doc = nlp(skills_content)
                 
-                for skill in self.skills:
-                    if re.search(r'\b' + re.escape(skill) + r'\b', skills_content, re.IGNORECASE):
+                for skill, skill_re in self._skill_word_res:
+                    if skill_re.search(skills_content):
                         normalized_skill = self.normalize_skill(skill)
                         skills.add(normalized_skill)
                 
@@ -211,6 +209,18 @@ class SkillsExtractor:
         except LangDetectException:
             return self.nlp_en
 
+    def _compile_skill_variations(self, skill: str):
+        """Compile all accepted spellings of a skill into a single case-insensitive pattern."""
+        variations = [
+            skill,
+            skill + 'js',
+            skill + '.js',
+            skill.replace('javascript', 'js'),
+            skill.replace('typescript', 'ts'),
+        ]
+        alternation = '|'.join(re.escape(variation) for variation in dict.fromkeys(variations))
+        return re.compile(r'\b(?:' + alternation + r')\b', re.IGNORECASE)
+
     def extract_noun_phrases(self, doc):
         """Custom method to extract noun phrases for Hungarian language."""
         noun_phrases = []
@@ -0,0 +1,39 @@
+# Standard library imports
+from itertools import product
+
+# Local imports
+from nlp_utils.current_position_extractor import CurrentPositionExtractor
+
+extractor = CurrentPositionExtractor(None, None)
+
+def first_month_in_map_order(date_str):
+    """Reference month lookup: the first month_map entry contained in the string wins."""
+    for month_str, month_num in CurrentPositionExtractor.month_map.items():
+        if month_str in date_str.lower():
+            return month_num
+    return 0
+
+def test_parse_date_months():
+    """Known month spellings resolve to the expected month number."""
+    assert extractor._parse_date('szept 2018') == (2018, 9)
+    assert extractor._parse_date('május 2020') == (2020, 5)
+    assert extractor._parse_date('február 2019') == (2019, 2)
+    assert extractor._parse_date('márc 2017') == (2017, 3)
+    assert extractor._parse_date('Mar 2017') == (2017, 3)
+    # 'mar' comes before 'dec' in the map, so it wins wherever it appears in the string
+    assert extractor._parse_date('Dec 2019 mar') == (2019, 3)
+    assert extractor._parse_date('2021') == (2021, 0)
+
+def test_parse_date_matches_map_order_lookup():
+    """The single-regex month lookup agrees with the map-order loop over every pair of month names."""
+    names = list(CurrentPositionExtractor.month_map)
+    for first, second in product(names, repeat=2):
+        date_strs = [f'{first} 2020', f'{first.upper()} 2020 {second}', f'{first}{second} 2020']
+        # Names sharing letters at the seam overlap, so a longer match can hide an earlier map entry
+        date_strs += [first + second[size:] for size in (1, 2) if first.endswith(second[:size])]
+        for date_str in date_strs:
+            assert extractor._parse_date(date_str)[1] == first_month_in_map_order(date_str), date_str
+
+if __name__ == "__main__":
+    test_parse_date_months()
+    test_parse_date_matches_map_order_lookup()
@@ -0,0 +1,32 @@
+# Standard library imports
+import random
+
+# Local imports
+from nlp_utils.cv_section_parser import CVSectionParser, _KeywordSet
+
+def count_by_substring(keywords, text_lower):
+    """Reference count: one substring check per keyword."""
+    return sum(1 for keyword in keywords if keyword in text_lower)
+
+def test_keyword_set_counts_overlapping_and_prefix_keywords():
+    """Keywords hidden inside or overlapping a longer match are still counted once each."""
+    keyword_set = _KeywordSet({'dev', 'developer', 'lop', 'per', 'oper'})
+    assert keyword_set.count('developer') == 5
+    assert keyword_set.count('develop develop') == 2
+    assert keyword_set.count('no match here') == 0
+
+def test_keyword_set_matches_substring_count():
+    """The single-scan count agrees with per-keyword substring checks on the parser's keyword sets."""
+    parser = CVSectionParser()
+    rng = random.Random(0)
+    for indicators in parser.section_content_indicators.values():
+        keywords = indicators['keywords']
+        keyword_set = indicators['keyword_set']
+        pieces = list(keywords) + [keyword[:3] for keyword in keywords] + [' ', 'x', 'and ']
+        for _ in range(2000):
+            text_lower = ''.join(rng.choice(pieces) for _ in range(rng.randint(0, 8)))
+            assert keyword_set.count(text_lower) == count_by_substring(keywords, text_lower), text_lower
+
+if __name__ == "__main__":
+    test_keyword_set_counts_overlapping_and_prefix_keywords()
+    test_keyword_set_matches_substring_count()